@@ -1,37 +1,59 @@
-from roseau.load_flow_single.models.branches import AbstractBranch
-from roseau.load_flow_single.models.buses import Bus
-from roseau.load_flow_single.models.core import Element
-from roseau.load_flow_single.models.lines import Line, LineParameters
-from roseau.load_flow_single.models.loads import (
-    AbstractLoad,
-    Control,
-    CurrentLoad,
-    FlexibleParameter,
-    ImpedanceLoad,
-    PowerLoad,
-    Projection,
-)
-from roseau.load_flow_single.models.sources import VoltageSource
-from roseau.load_flow_single.models.switches import Switch
-from roseau.load_flow_single.models.transformers import Transformer, TransformerParameters
-from roseau.load_flow_single.network import ElectricalNetwork
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
-    "Element",
-    "Line",
-    "LineParameters",
-    "Bus",
-    "ElectricalNetwork",
-    "VoltageSource",
-    "PowerLoad",
-    "AbstractLoad",
-    "CurrentLoad",
-    "ImpedanceLoad",
-    "Switch",
-    "Transformer",
-    "TransformerParameters",
-    "FlexibleParameter",
-    "Projection",
-    "Control",
-    "AbstractBranch",
-]
+if TYPE_CHECKING:
+    from roseau.load_flow_single.models.branches import AbstractBranch
+    from roseau.load_flow_single.models.buses import Bus
+    from roseau.load_flow_single.models.core import Element
+    from roseau.load_flow_single.models.lines import Line, LineParameters
+    from roseau.load_flow_single.models.loads import (
+        AbstractLoad,
+        Control,
+        CurrentLoad,
+        FlexibleParameter,
+        ImpedanceLoad,
+        PowerLoad,
+        Projection,
+    )
+    from roseau.load_flow_single.models.sources import VoltageSource
+    from roseau.load_flow_single.models.switches import Switch
+    from roseau.load_flow_single.models.transformers import Transformer, TransformerParameters
+    from roseau.load_flow_single.network import ElectricalNetwork
+
+# The public objects are imported lazily on first access (PEP 562) so that importing the package does not
+# pull in shapely, pint and numpy until they are needed.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Element": "roseau.load_flow_single.models.core",
+    "Line": "roseau.load_flow_single.models.lines",
+    "LineParameters": "roseau.load_flow_single.models.lines",
+    "Bus": "roseau.load_flow_single.models.buses",
+    "ElectricalNetwork": "roseau.load_flow_single.network",
+    "VoltageSource": "roseau.load_flow_single.models.sources",
+    "PowerLoad": "roseau.load_flow_single.models.loads",
+    "AbstractLoad": "roseau.load_flow_single.models.loads",
+    "CurrentLoad": "roseau.load_flow_single.models.loads",
+    "ImpedanceLoad": "roseau.load_flow_single.models.loads",
+    "Switch": "roseau.load_flow_single.models.switches",
+    "Transformer": "roseau.load_flow_single.models.transformers",
+    "TransformerParameters": "roseau.load_flow_single.models.transformers",
+    "FlexibleParameter": "roseau.load_flow_single.models.loads",
+    "Projection": "roseau.load_flow_single.models.loads",
+    "Control": "roseau.load_flow_single.models.loads",
+    "AbstractBranch": "roseau.load_flow_single.models.branches",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache it so that __getattr__ is only called once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
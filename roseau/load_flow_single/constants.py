@@ -0,0 +1,36 @@
+"""
+Numerical constants and units used in the single-phase models.
+"""
+
+import math
+from typing import Final
+
+from pint.util import to_units_container
+
+from roseau.load_flow.units import ureg
+
+SQRT3: Final = math.sqrt(3.0)
+"""The square root of 3, the ratio between the phase-to-phase and the phase-to-neutral voltages."""
+
+CONNECTIONS: Final = ((0, 0), (1, 1))
+"""The connections of the two conductors of the loads and sources to the two conductors of their bus."""
+
+# The models convert their quantities themselves instead of going through `ureg_wraps` in the hot paths. The getters
+# build their results directly from these units and the setters convert to these unparsed units, as `ureg_wraps` does,
+# to keep the short unit names in pint errors.
+AMPERE: Final = ureg.Unit("A")
+VOLT: Final = ureg.Unit("V")
+VOLT_AMPERE: Final = ureg.Unit("VA")
+VOLT_AMPERE_REACTIVE: Final = ureg.Unit("VAr")
+OHM: Final = ureg.Unit("ohm")
+KILOMETER: Final = ureg.Unit("km")
+DIMENSIONLESS: Final = ureg.Unit("")
+
+AMPERE_CONTAINER: Final = to_units_container("A")
+VOLT_CONTAINER: Final = to_units_container("V")
+VOLT_AMPERE_CONTAINER: Final = to_units_container("VA")
+VOLT_AMPERE_REACTIVE_CONTAINER: Final = to_units_container("VAr")
+OHM_CONTAINER: Final = to_units_container("ohm")
+OHM_PER_KM_CONTAINER: Final = to_units_container("ohm/km")
+SIEMENS_PER_KM_CONTAINER: Final = to_units_container("S/km")
+SQUARE_MILLIMETER_CONTAINER: Final = to_units_container("mm²")
@@ -0,0 +1,96 @@
+"""
+This module is not for public use.
+
+Read and write JSON files using :mod:`orjson` when it is installed and the standard library
+:mod:`json` module otherwise.
+"""
+
+import json
+import math
+import re
+from pathlib import Path
+
+import numpy as np
+
+from roseau.load_flow.typing import JsonDict, StrPath
+from roseau.load_flow.utils.mixins import _json_encoder_default
+
+try:
+    import orjson
+except ImportError:  # pragma: no-cover
+    orjson = None
+
+# Collapse multi-line arrays of 2-to-4 elements into single line
+# e.g complex value represented as [real, imag] or rows of the z_line matrix
+# This is the pattern of `JsonMixin.to_json` of roseau-load-flow which inlines it, it cannot be imported
+_COLLAPSE_ARRAYS_RE = re.compile(r"\[(?:\s+(\S+,))?(?:\s+?( \S+,))??(?:\s+?( \S+,))??\s+?( \S+)\s+]")
+
+
+def json_load(path: StrPath) -> JsonDict:
+    """Read a JSON file.
+
+    Args:
+        path:
+            The path to the JSON file.
+
+    Returns:
+        The decoded JSON data.
+    """
+    content = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. the NaN and Infinity tokens written by the json module are not valid JSON
+    return json.loads(content)
+
+
+def _has_non_finite_floats(data: object) -> bool:
+    """Whether the JSON serializable data contains NaN or infinite floats."""
+    if isinstance(data, float | np.floating):
+        return not math.isfinite(data)
+    elif isinstance(data, dict):
+        return any(_has_non_finite_floats(v) for v in data.values())
+    elif isinstance(data, list | tuple):
+        return any(_has_non_finite_floats(v) for v in data)
+    elif isinstance(data, np.ndarray) and data.dtype.kind in "fc":
+        return not np.isfinite(data).all()
+    return False
+
+
+def json_dump(data: JsonDict, path: StrPath) -> Path:
+    """Write a JSON file with the same layout as the one of the `to_json` methods.
+
+    The files written with :mod:`orjson` decode to the same data as those written with the :mod:`json`
+    module but they are not byte-identical: floats with an exponent are written without padding
+    (e.g. ``1e-8`` instead of ``1e-08``).
+
+    Args:
+        data:
+            The JSON serializable data to write.
+
+        path:
+            The path to the output file. It is expanded then resolved before writing the file.
+
+    Returns:
+        The expanded and resolved path of the written file.
+    """
+    output = None
+    if orjson is not None:
+        output = orjson.dumps(
+            data,
+            default=_json_encoder_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+        # orjson writes NaN and infinite floats as null, the json module is used to keep them in the file.
+        # The data is only scanned when there are nulls in the output, which is rare for the network data.
+        if "null" in output and _has_non_finite_floats(data):
+            output = None
+    if output is None:
+        output = json.dumps(data, ensure_ascii=False, indent=2, default=_json_encoder_default)
+    output = _COLLAPSE_ARRAYS_RE.sub(r"[\1\2\3\4]", output)
+    if not output.endswith("\n"):
+        output += "\n"
+    path = Path(path).expanduser().resolve()
+    path.write_text(output)
+    return path
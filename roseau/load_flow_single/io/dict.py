@@ -6,9 +6,13 @@ from and to dictionaries, or the methods `ElectricalNetwork.from_json` and `Elec
 to read and write networks from and to JSON files.
 """
 
-import copy
 import logging
-from typing import TYPE_CHECKING, TypeVar
+from collections.abc import Callable, Collection
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+import numpy as np
+from shapely.geometry.base import BaseGeometry
 
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.typing import Id, JsonDict
@@ -25,39 +29,52 @@ from roseau.load_flow_single.models import (
 )
 
 if TYPE_CHECKING:
-    from roseau.load_flow.network import ElectricalNetwork
+    from roseau.load_flow_single.network import ElectricalNetwork
 
 logger = logging.getLogger(__name__)
 
 NETWORK_JSON_VERSION = 2
 """The current version of the network JSON file format."""
 
-_T = TypeVar("_T", bound=AbstractBranch)
-
 
-def _assign_branch_currents(branch: _T, branch_data: JsonDict) -> _T:
+def _assign_branch_currents(branch: AbstractBranch, results: JsonDict) -> None:
     """Small helper to assign the currents results to a branch object.
 
     Args:
         branch:
             The object to assign the results.
 
-        branch_data:
-            The data of the branch which may contain the results.
+        results:
+            The results of the branch data.
+    """
+    i1, i2 = results["current1"], results["current2"]
+    branch._res_currents = complex(i1[0], i1[1]), complex(i2[0], i2[1])
+    branch._fetch_results = False
+    branch._no_results = False
+
+
+def _memoized_geometry_parser() -> Callable[[str | JsonDict | None], BaseGeometry | None]:
+    """Small helper to create a geometry parser that reuses the geometries already parsed.
+
+    Branches often share the same geometry. Shapely geometries are immutable so the same object can
+    safely be used by several branches.
 
     Returns:
-        The updated `branch` object.
+        A function parsing a WKT string or a GeoJSON dictionary into a shapely geometry.
     """
-    if "results" in branch_data:
-        i = branch_data["results"]["current1"]
-        current1 = complex(i[0], i[1])
-        i = branch_data["results"]["current2"]
-        current2 = complex(i[0], i[1])
-        branch._res_currents = current1, current2
-        branch._fetch_results = False
-        branch._no_results = False
+    cache: dict[str, BaseGeometry] = {}
+    parse_geometry = AbstractBranch._parse_geometry
+
+    def memoized_parse_geometry(geometry: str | JsonDict | None) -> BaseGeometry | None:
+        if geometry is None:
+            return None
+        key = geometry if isinstance(geometry, str) else repr(geometry)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = parse_geometry(geometry)
+        return result
 
-    return branch
+    return memoized_parse_geometry
 
 
 def network_from_dict(
@@ -85,8 +102,6 @@ def network_from_dict(
         The buses, lines, transformers, switches, loads, sources, grounds and potential refs to construct the electrical
         network and a boolean indicating if the network has results.
     """
-    data = copy.deepcopy(data)  # Make a copy to avoid modifying the original
-
     # version = data.get("version", 0)
     # TODO version check
 
@@ -94,9 +109,6 @@ def network_from_dict(
     is_multiphase = data.get("is_multiphase", True)
     assert not is_multiphase, f"Unsupported phase selection {is_multiphase=}."
 
-    # Track if ALL results are included in the network
-    has_results = include_results
-
     # Lines and transformers parameters
     lines_params = {
         lp["id"]: LineParameters.from_dict(data=lp, include_results=include_results) for lp in data["lines_params"]
@@ -106,73 +118,109 @@ def network_from_dict(
         for tp in data["transformers_params"]
     }
 
+    # Bind the methods used in the loops below to local names to avoid repeated attribute lookups
+    bus_from_dict = Bus.from_dict
+    load_from_dict = AbstractLoad.from_dict
+    source_from_dict = VoltageSource.from_dict
+    parse_geometry = _memoized_geometry_parser()
+
     # Buses, loads and sources
     buses: dict[Id, Bus] = {}
     for bus_data in data["buses"]:
-        bus = Bus.from_dict(data=bus_data, include_results=include_results)
+        bus = bus_from_dict(data=bus_data, include_results=include_results)
         buses[bus.id] = bus
-        has_results = has_results and not bus._no_results
+    get_bus = buses.__getitem__
     loads: dict[Id, AbstractLoad] = {}
     for load_data in data["loads"]:
-        load_data["bus"] = buses[load_data["bus"]]
-        load = AbstractLoad.from_dict(data=load_data, include_results=include_results)
+        load_data = {**load_data, "bus": get_bus(load_data["bus"])}  # Do not modify the original
+        load = load_from_dict(data=load_data, include_results=include_results)
         loads[load.id] = load
-        has_results = has_results and not load._no_results
     sources: dict[Id, VoltageSource] = {}
     for source_data in data["sources"]:
-        source_data["bus"] = buses[source_data["bus"]]
-        source = VoltageSource.from_dict(data=source_data, include_results=include_results)
+        source_data = {**source_data, "bus": get_bus(source_data["bus"])}  # Do not modify the original
+        source = source_from_dict(data=source_data, include_results=include_results)
         sources[source.id] = source
-        has_results = has_results and not source._no_results
 
     # Lines
     lines_dict: dict[Id, Line] = {}
     for line_data in data["lines"]:
         id = line_data["id"]
-        bus1 = buses[line_data["bus1"]]
-        bus2 = buses[line_data["bus2"]]
-        geometry = Line._parse_geometry(line_data.get("geometry"))
+        bus1 = get_bus(line_data["bus1"])
+        bus2 = get_bus(line_data["bus2"])
+        geometry = parse_geometry(line_data.get("geometry"))
         length = line_data["length"]
         lp = lines_params[line_data["params_id"]]
         line = Line(id=id, bus1=bus1, bus2=bus2, parameters=lp, length=length, geometry=geometry)
-        if include_results:
-            line = _assign_branch_currents(branch=line, branch_data=line_data)
-
-        has_results = has_results and not line._no_results
+        if include_results and (results := line_data.get("results")) is not None:
+            _assign_branch_currents(branch=line, results=results)
         lines_dict[id] = line
 
     # Transformers
     transformers_dict: dict[Id, Transformer] = {}
     for transformer_data in data["transformers"]:
         id = transformer_data["id"]
-        bus1 = buses[transformer_data["bus1"]]
-        bus2 = buses[transformer_data["bus2"]]
-        geometry = Transformer._parse_geometry(transformer_data.get("geometry"))
+        bus1 = get_bus(transformer_data["bus1"])
+        bus2 = get_bus(transformer_data["bus2"])
+        geometry = parse_geometry(transformer_data.get("geometry"))
         tp = transformers_params[transformer_data["params_id"]]
         transformer = Transformer(id=id, bus1=bus1, bus2=bus2, parameters=tp, geometry=geometry)
-        if include_results:
-            transformer = _assign_branch_currents(branch=transformer, branch_data=transformer_data)
-
-        has_results = has_results and not transformer._no_results
+        if include_results and (results := transformer_data.get("results")) is not None:
+            _assign_branch_currents(branch=transformer, results=results)
         transformers_dict[id] = transformer
 
     # Switches
     switches_dict: dict[Id, Switch] = {}
     for switch_data in data["switches"]:
         id = switch_data["id"]
-        bus1 = buses[switch_data["bus1"]]
-        bus2 = buses[switch_data["bus2"]]
-        geometry = Switch._parse_geometry(switch_data.get("geometry"))
+        bus1 = get_bus(switch_data["bus1"])
+        bus2 = get_bus(switch_data["bus2"])
+        geometry = parse_geometry(switch_data.get("geometry"))
         switch = Switch(id=id, bus1=bus1, bus2=bus2, geometry=geometry)
-        if include_results:
-            switch = _assign_branch_currents(branch=switch, branch_data=switch_data)
-
-        has_results = has_results and not switch._no_results
+        if include_results and (results := switch_data.get("results")) is not None:
+            _assign_branch_currents(branch=switch, results=results)
         switches_dict[id] = switch
 
+    # Check if ALL results are included in the network
+    has_results = include_results and not any(
+        element._no_results
+        for elements in (buses, loads, sources, lines_dict, transformers_dict, switches_dict)
+        for element in elements.values()
+    )
+
     return buses, lines_dict, transformers_dict, switches_dict, loads, sources, has_results
 
 
+def _branches_to_dict(
+    en: "ElectricalNetwork", branches: Collection[AbstractBranch], include_results: bool
+) -> list[JsonDict]:
+    """Small helper to convert branches to dictionaries.
+
+    The currents results of all the branches are gathered in a single array and converted to lists
+    of [real, imag] parts in one vectorized pass instead of branch by branch.
+
+    Args:
+        en:
+            The electrical network of the branches.
+
+        branches:
+            The branches to convert.
+
+        include_results:
+            If True, the currents results of the branches are included in the dictionaries.
+
+    Returns:
+        The list of the branches dictionaries.
+    """
+    res = [branch.to_dict(include_results=False) for branch in branches]
+    if include_results and res:
+        currents = en._gather_branch_currents(branches, warning=True)
+        # View the (N, 2) complex array as a (N, 2, 2) array of [real, imag] parts
+        currents_parts = currents.view(np.float64).reshape(-1, 2, 2).tolist()
+        for branch_data, (current1, current2) in zip(res, currents_parts, strict=True):
+            branch_data["results"] = {"current1": current1, "current2": current2}
+    return res
+
+
 def network_to_dict(en: "ElectricalNetwork", *, include_results: bool) -> JsonDict:
     """Return a dictionary of the current network data.
 
@@ -188,12 +236,16 @@ def network_to_dict(en: "ElectricalNetwork", *, include_results: bool) -> JsonDi
         The created dictionary.
     """
     # Export the buses, loads and sources
-    buses: list[JsonDict] = []
+    buses = [bus.to_dict(include_results=False) for bus in en.buses.values()]
+    if include_results and buses:
+        potentials = en._gather_buses_potentials(en.buses.values(), warning=True)
+        # View the (N,) complex array as a (N, 2) array of [real, imag] parts
+        for bus_data, potential in zip(buses, potentials.view(np.float64).reshape(-1, 2).tolist(), strict=True):
+            bus_data["results"] = {"potential": potential}
     loads: list[JsonDict] = []
     sources: list[JsonDict] = []
     short_circuits: list[JsonDict] = []
     for bus in en.buses.values():
-        buses.append(bus.to_dict(include_results=include_results))
         for element in bus._connected_elements:
             if isinstance(element, AbstractLoad):
                 assert element.bus is bus
@@ -203,45 +255,47 @@ def network_to_dict(en: "ElectricalNetwork", *, include_results: bool) -> JsonDi
                 sources.append(element.to_dict(include_results=include_results))
 
     # Export the lines with their parameters
-    lines: list[JsonDict] = []
+    lines = _branches_to_dict(en, en.lines.values(), include_results=include_results)
     lines_params_dict: dict[Id, LineParameters] = {}
     for line in en.lines.values():
-        lines.append(line.to_dict(include_results=include_results))
-        params_id = line.parameters.id
-        if params_id in lines_params_dict and line.parameters != lines_params_dict[params_id]:
+        lp = line.parameters
+        params_id = lp.id
+        # Parameters are usually shared between lines, check the identity before the (costly) equality
+        existing_lp = lines_params_dict.get(params_id)
+        if existing_lp is not None and existing_lp is not lp and existing_lp != lp:
             msg = f"There are multiple line parameters with id {params_id!r}"
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.JSON_LINE_PARAMETERS_DUPLICATES)
-        lines_params_dict[line.parameters.id] = line.parameters
+        lines_params_dict[params_id] = lp
 
     # Export the transformers with their parameters
-    transformers: list[JsonDict] = []
+    transformers = _branches_to_dict(en, en.transformers.values(), include_results=include_results)
     transformers_params_dict: dict[Id, TransformerParameters] = {}
     for transformer in en.transformers.values():
-        transformers.append(transformer.to_dict(include_results=include_results))
-        params_id = transformer.parameters.id
-        if params_id in transformers_params_dict and transformer.parameters != transformers_params_dict[params_id]:
+        tp = transformer.parameters
+        params_id = tp.id
+        existing_tp = transformers_params_dict.get(params_id)
+        if existing_tp is not None and existing_tp is not tp and existing_tp != tp:
             msg = f"There are multiple transformer parameters with id {params_id!r}"
             logger.error(msg)
             raise RoseauLoadFlowException(
                 msg=msg, code=RoseauLoadFlowExceptionCode.JSON_TRANSFORMER_PARAMETERS_DUPLICATES
             )
-        transformers_params_dict[params_id] = transformer.parameters
+        transformers_params_dict[params_id] = tp
 
     # Export the switches
-    switches = [switch.to_dict(include_results=include_results) for switch in en.switches.values()]
-
-    # Line parameters
-    line_params: list[JsonDict] = []
-    for lp in lines_params_dict.values():
-        line_params.append(lp.to_dict(include_results=include_results))
-    line_params.sort(key=lambda x: x["id"])  # Always keep the same order
-
-    # Transformer parameters
-    transformer_params: list[JsonDict] = []
-    for tp in transformers_params_dict.values():
-        transformer_params.append(tp.to_dict(include_results=include_results))
-    transformer_params.sort(key=lambda x: x["id"])  # Always keep the same order
+    switches = _branches_to_dict(en, en.switches.values(), include_results=include_results)
+
+    # Line parameters (always keep the same order)
+    line_params = sorted(
+        (lp.to_dict(include_results=include_results) for lp in lines_params_dict.values()), key=itemgetter("id")
+    )
+
+    # Transformer parameters (always keep the same order)
+    transformer_params = sorted(
+        (tp.to_dict(include_results=include_results) for tp in transformers_params_dict.values()),
+        key=itemgetter("id"),
+    )
 
     res = {
         "version": NETWORK_JSON_VERSION,
@@ -1,11 +1,12 @@
 import logging
+from typing import ClassVar
 
-import numpy as np
 from shapely.geometry.base import BaseGeometry
 from typing_extensions import Self
 
 from roseau.load_flow.typing import Complex, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow_single.constants import SQRT3
 from roseau.load_flow_single.models.buses import Bus
 from roseau.load_flow_single.models.core import Element
 
@@ -21,6 +22,9 @@ class AbstractBranch(Element):
         :doc:`Switch model documentation </models/Switch>`
     """
 
+    _is_galvanic: ClassVar[bool] = False
+    """Whether the branch galvanically connects its buses (lines and switches) or not (transformers)."""
+
     def __init__(self, id: Id, bus1: Bus, bus2: Bus, n: int, *, geometry: BaseGeometry | None = None) -> None:
         """AbstractBranch constructor.
 
@@ -45,6 +49,9 @@ class AbstractBranch(Element):
         self._n = n
         self.geometry = geometry
         self._connect(bus1, bus2)
+        if self._is_galvanic:
+            bus1._galvanic_branches.append(self)
+            bus2._galvanic_branches.append(self)
         self._res_currents: tuple[Complex, Complex] | None = None
 
     def __repr__(self) -> str:
@@ -62,8 +69,8 @@ class AbstractBranch(Element):
 
     def _res_currents_getter(self, warning: bool) -> tuple[Complex, Complex]:
         if self._fetch_results:
-            cur1, cur2 = self._cy_element.get_currents(1, 1)
-            self._res_currents = cur1[0], cur2[0]
+            cur1, cur2 = self._cy_get_currents(1, 1)
+            self._res_currents = cur1.item(), cur2.item()  # Python complex scalars
         return self._res_getter(value=self._res_currents, warning=warning)
 
     @property
@@ -104,7 +111,7 @@ class AbstractBranch(Element):
     ) -> tuple[Complex, Complex]:
         if potential1 is None or potential2 is None:
             potential1, potential2 = self._res_potentials_getter(warning)
-        return potential1 * np.sqrt(3.0), potential2 * np.sqrt(3.0)
+        return potential1 * SQRT3, potential2 * SQRT3
 
     @property
     @ureg_wraps(("V", "V"), (None,))
@@ -114,6 +121,7 @@ class AbstractBranch(Element):
 
     def _cy_connect(self) -> None:
         """Connect the Cython elements of the buses and the branch"""
+        self._cy_get_currents = self._cy_element.get_currents  # bound once, used by the results getter
         assert isinstance(self.bus1, Bus)
         for i in range(self._n):
             self._cy_element.connect(self.bus1._cy_element, [(i, i)], True)
@@ -122,6 +130,14 @@ class AbstractBranch(Element):
         for i in range(self._n):
             self._cy_element.connect(self.bus2._cy_element, [(i, i)], False)
 
+    def _disconnect(self) -> None:
+        if self._is_galvanic:
+            for bus in (self._bus1, self._bus2):
+                if self in bus._galvanic_branches:
+                    bus._galvanic_branches.remove(self)
+        super()._disconnect()
+        self._cy_get_currents = None  # bound to the deleted Cython element
+
     #
     # Json Mixin interface
     #
@@ -135,8 +151,8 @@ class AbstractBranch(Element):
             "bus1": self.bus1.id,
             "bus2": self.bus2.id,
         }
-        if self.geometry is not None:
-            res["geometry"] = self.geometry.__geo_interface__
+        if (geometry := self._geo_interface_getter()) is not None:
+            res["geometry"] = geometry
         if include_results:
             current1, current2 = self._res_currents_getter(warning=True)
             res["results"] = {
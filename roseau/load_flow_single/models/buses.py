@@ -1,7 +1,7 @@
 import logging
 import warnings
 from collections.abc import Iterator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
@@ -13,11 +13,20 @@ from roseau.load_flow.typing import Complex, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow.utils._exceptions import find_stack_level
 from roseau.load_flow_engine.cy_engine import CyBus
-from roseau.load_flow_single.models.core import Element
+from roseau.load_flow_single.constants import SQRT3, VOLT, VOLT_CONTAINER
+from roseau.load_flow_single.models.core import Element, _engine_buffer
+
+if TYPE_CHECKING:
+    from roseau.load_flow_single.models.branches import AbstractBranch
 
 logger = logging.getLogger(__name__)
 
 
+def _is_missing(value: float | None) -> bool:
+    """Check if a scalar limit is missing, i.e. None or NaN (cheaper than `pd.isna` for scalars)."""
+    return value is None or value is pd.NA or value != value
+
+
 class Bus(Element):
     """An electrical bus."""
 
@@ -56,6 +65,9 @@ class Bus(Element):
                 Either a float (unitless) or a :class:`Quantity <roseau.load_flow.units.Q_>` of float.
         """
         super().__init__(id)
+        # The lines and switches connected to the bus, used to find the galvanically connected buses
+        self._galvanic_branches: list[AbstractBranch] = []
+        self._potentials_buffer = _engine_buffer(2)
         initialized = potential is not None
         if potential is None:
             potential = 0.0
@@ -77,42 +89,42 @@ class Bus(Element):
         self._n = 2
         self._initialized = initialized
         self._initialized_by_the_user = initialized  # only used for serialization
-        self._cy_element = CyBus(n=self._n, potentials=np.array([self._potential, 0], dtype=np.complex128))
+        self._cy_element = CyBus(n=self._n, potentials=self._potentials_buffer)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id!r})"
 
     @property
-    @ureg_wraps("V", (None,))
     def potential(self) -> Q_[Complex]:
         """An array of initial potentials of the bus (V)."""
-        return self._potential
+        return Q_(self._potential, VOLT)
 
     @potential.setter
-    @ureg_wraps(None, (None, "V"))
-    def potential(self, value: float) -> None:
-        self._potential = value / np.sqrt(3.0)
+    def potential(self, value: complex | Q_[complex]) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_CONTAINER)
+        self._potential = value / SQRT3
+        self._potentials_buffer[0] = self._potential
         self._invalidate_network_results()
         self._initialized = True
         self._initialized_by_the_user = True
         if self._cy_element is not None:
-            self._cy_element.initialize_potentials(np.array([self._potential, 0], dtype=np.complex128))
+            self._cy_element.initialize_potentials(self._potentials_buffer)
 
     def _res_potential_getter(self, warning: bool) -> Complex:
         if self._fetch_results:
-            self._res_potential = self._cy_element.get_potentials(self._n)[0]
+            self._res_potential = self._cy_element.get_potentials(self._n).item(0)
         return self._res_getter(value=self._res_potential, warning=warning)
 
     def _res_voltage_getter(self, warning: bool, potential: Complex | None = None) -> Complex:
         if potential is None:
             potential = self._res_potential_getter(warning=warning)
-        return potential * np.sqrt(3.0)
+        return potential * SQRT3
 
     @property
-    @ureg_wraps("V", (None,))
     def res_voltage(self) -> Q_[Complex]:
         """The load flow result of the bus voltages (V)."""
-        return self._res_voltage_getter(warning=True)
+        return Q_(self._res_voltage_getter(warning=True), VOLT)
 
     @property
     def res_voltage_level(self) -> Q_[float] | None:
@@ -130,11 +142,13 @@ class Bus(Element):
     @nominal_voltage.setter
     @ureg_wraps(None, (None, "V"))
     def nominal_voltage(self, value: float | Q_[float] | None) -> None:
-        if pd.isna(value):
+        self._set_nominal_voltage(value)
+
+    def _set_nominal_voltage(self, value: float | None) -> None:
+        if _is_missing(value):
             value = None
         if value is None:
             if self._max_voltage_level is not None or self._min_voltage_level is not None:
-                print("hey")
                 warnings.warn(
                     message=(
                         f"The nominal voltage of the bus {self.id!r} is required to use `min_voltage_level` and "
@@ -158,7 +172,10 @@ class Bus(Element):
     @min_voltage_level.setter
     @ureg_wraps(None, (None, ""))
     def min_voltage_level(self, value: float | Q_[float] | None) -> None:
-        if pd.isna(value):
+        self._set_min_voltage_level(value)
+
+    def _set_min_voltage_level(self, value: float | None) -> None:
+        if _is_missing(value):
             value = None
         if value is not None:
             if self._max_voltage_level is not None and value > self._max_voltage_level:
@@ -197,7 +214,10 @@ class Bus(Element):
     @max_voltage_level.setter
     @ureg_wraps(None, (None, ""))
     def max_voltage_level(self, value: float | Q_[float] | None) -> None:
-        if pd.isna(value):
+        self._set_max_voltage_level(value)
+
+    def _set_max_voltage_level(self, value: float | None) -> None:
+        if _is_missing(value):
             value = None
         if value is not None:
             if self._min_voltage_level is not None and value < self._min_voltage_level:
@@ -233,17 +253,14 @@ class Bus(Element):
 
         Returns ``None`` if the bus has no voltage limits are not set.
         """
-        if (self._min_voltage_level is None and self._max_voltage_level is None) or self._nominal_voltage is None:
+        min_voltage_level = self._min_voltage_level
+        max_voltage_level = self._max_voltage_level
+        if (min_voltage_level is None and max_voltage_level is None) or self._nominal_voltage is None:
             return None
-        voltage = abs(self._res_voltage_getter(warning=True))
-        voltage_level = voltage / self._nominal_voltage
-        if self._min_voltage_level is None:
-            assert self._max_voltage_level is not None
-            return voltage_level > self._max_voltage_level
-        elif self._max_voltage_level is None:
-            return voltage_level < self._min_voltage_level
-        else:
-            return voltage_level < self._min_voltage_level or voltage_level > self._max_voltage_level
+        voltage_level = abs(self._res_voltage_getter(warning=True)) / self._nominal_voltage
+        return (min_voltage_level is not None and voltage_level < min_voltage_level) or (
+            max_voltage_level is not None and voltage_level > max_voltage_level
+        )
 
     def propagate_limits(self, force: bool = False) -> None:
         """Propagate the voltage limits to galvanically connected buses.
@@ -262,24 +279,20 @@ class Bus(Element):
                 limits different from this bus. If ``True``, the limits are propagated even if
                 connected buses have different limits.
         """
-        from roseau.load_flow_single.models.lines import Line
-        from roseau.load_flow_single.models.switches import Switch
-
         buses: set[Bus] = set()
-        visited: set[Element] = set()
-        remaining = set(self._connected_elements)
+        visited: set[AbstractBranch] = set(self._galvanic_branches)
+        remaining = list(self._galvanic_branches)
 
         while remaining:
             branch = remaining.pop()
-            visited.add(branch)
-            if not isinstance(branch, (Line, Switch)):
-                continue
-            for element in branch._connected_elements:
-                if not isinstance(element, Bus) or element is self or element in buses:
+            for element in (branch._bus1, branch._bus2):
+                if element is self or element in buses:
                     continue
                 buses.add(element)
-                to_add = set(element._connected_elements).difference(visited)
-                remaining.update(to_add)
+                for b in element._galvanic_branches:
+                    if b not in visited:
+                        visited.add(b)
+                        remaining.append(b)
                 if not (
                     force
                     or self._nominal_voltage is None
@@ -327,27 +340,23 @@ class Bus(Element):
 
         These are all the buses connected via one or more lines or switches to this bus.
         """
-        from roseau.load_flow_single.models.lines import Line
-        from roseau.load_flow_single.models.switches import Switch
-
         visited_buses = {self.id}
         yield self.id
 
-        visited: set[Element] = set()
-        remaining = set(self._connected_elements)
+        visited: set[AbstractBranch] = set(self._galvanic_branches)
+        remaining = list(self._galvanic_branches)
 
         while remaining:
             branch = remaining.pop()
-            visited.add(branch)
-            if not isinstance(branch, (Line, Switch)):
-                continue
-            for element in branch._connected_elements:
-                if not isinstance(element, Bus) or element.id in visited_buses:
+            for element in (branch._bus1, branch._bus2):
+                if element.id in visited_buses:
                     continue
                 visited_buses.add(element.id)
                 yield element.id
-                to_add = set(element._connected_elements).difference(visited)
-                remaining.update(to_add)
+                for b in element._galvanic_branches:
+                    if b not in visited:
+                        visited.add(b)
+                        remaining.append(b)
 
     #
     # Json Mixin interface
@@ -357,14 +366,14 @@ class Bus(Element):
         geometry = cls._parse_geometry(data.get("geometry"))
         if (potential := data.get("potential")) is not None:
             potential = complex(potential[0], potential[1])
-        self = cls(
-            id=data["id"],
-            geometry=geometry,
-            potential=potential,
-            nominal_voltage=data.get("nominal_voltage"),
-            min_voltage_level=data.get("min_voltage_level"),
-            max_voltage_level=data.get("max_voltage_level"),
-        )
+        self = cls(id=data["id"], geometry=geometry, potential=potential)
+        # The serialized limits are plain floats, set them without going through the units wrappers
+        if (nominal_voltage := data.get("nominal_voltage")) is not None:
+            self._set_nominal_voltage(nominal_voltage)
+        if (min_voltage_level := data.get("min_voltage_level")) is not None:
+            self._set_min_voltage_level(min_voltage_level)
+        if (max_voltage_level := data.get("max_voltage_level")) is not None:
+            self._set_max_voltage_level(max_voltage_level)
         if include_results and "results" in data:
             self._res_potential = complex(data["results"]["potential"][0], data["results"]["potential"][1])
             self._fetch_results = False
@@ -375,14 +384,14 @@ class Bus(Element):
         res = {"id": self.id}
         if self._initialized_by_the_user:
             res["potential"] = [self._potential.real, self._potential.imag]
-        if self.geometry is not None:
-            res["geometry"] = self.geometry.__geo_interface__
-        if self.nominal_voltage is not None:
-            res["nominal_voltage"] = self.nominal_voltage.magnitude
-        if self.min_voltage_level is not None:
-            res["min_voltage_level"] = self.min_voltage_level.magnitude
-        if self.max_voltage_level is not None:
-            res["max_voltage_level"] = self.max_voltage_level.magnitude
+        if (geometry := self._geo_interface_getter()) is not None:
+            res["geometry"] = geometry
+        if self._nominal_voltage is not None:
+            res["nominal_voltage"] = self._nominal_voltage
+        if self._min_voltage_level is not None:
+            res["min_voltage_level"] = self._min_voltage_level
+        if self._max_voltage_level is not None:
+            res["max_voltage_level"] = self._max_voltage_level
         if include_results:
             potential = self._res_potential_getter(warning=True)
             res["results"] = {"potential": [potential.real, potential.imag]}
@@ -3,12 +3,13 @@ import warnings
 from abc import ABC
 from typing import TYPE_CHECKING, Any, NoReturn, Optional, TypeVar
 
+import numpy as np
 import shapely
 from shapely.geometry import shape
 from shapely.geometry.base import BaseGeometry
 
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
-from roseau.load_flow.typing import Id
+from roseau.load_flow.typing import ComplexArray, Id, JsonDict
 from roseau.load_flow.utils import Identifiable, JsonMixin
 from roseau.load_flow_engine.cy_engine import CyElement
 
@@ -20,6 +21,24 @@ logger = logging.getLogger(__name__)
 _T = TypeVar("_T")
 
 
+def _copy_geo_interface(geo_interface: JsonDict) -> JsonDict:
+    """Copy the GeoJSON mapping of a geometry so that modifying the copy leaves the original intact.
+
+    The coordinates are nested tuples, they are immutable and shared with the original mapping.
+    """
+    if "geometries" in geo_interface:  # the geometry collections hold a list of mappings
+        return {**geo_interface, "geometries": [_copy_geo_interface(g) for g in geo_interface["geometries"]]}
+    return dict(geo_interface)
+
+
+def _engine_buffer(size: int = 1) -> ComplexArray:
+    """Allocate a buffer of complex values to pass to the engine.
+
+    The engine copies the values it is given, an element allocates its buffer once and reuses it for every update.
+    """
+    return np.zeros(size, dtype=np.complex128)
+
+
 class Element(ABC, Identifiable, JsonMixin):
     """An abstract class of an element in an Electrical network."""
 
@@ -40,12 +59,33 @@ class Element(ABC, Identifiable, JsonMixin):
         self._fetch_results = False
         self._no_results = True
         self._results_valid = True
+        self._geometry: BaseGeometry | None = None
+        # The GeoJSON mapping of the geometry is computed once, when the element is first serialized
+        self._geo_interface: JsonDict | None = None
 
     @property
     def network(self) -> Optional["ElectricalNetwork"]:
         """Return the network the element belong to (if any)."""
         return self._network
 
+    @property
+    def geometry(self) -> BaseGeometry | None:
+        """The geometry of the element."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value: BaseGeometry | None) -> None:
+        self._geometry = value
+        self._geo_interface = None
+
+    def _geo_interface_getter(self) -> JsonDict | None:
+        """A copy of the GeoJSON mapping of the geometry of the element, computed on first use."""
+        if self._geometry is None:
+            return None
+        if self._geo_interface is None:
+            self._geo_interface = self._geometry.__geo_interface__
+        return _copy_geo_interface(self._geo_interface)
+
     def _set_network(self, value: Optional["ElectricalNetwork"]) -> None:
         """Network setter with the ability to set the network to `None`. This method must not be exposed through a
         traditional public setter. It is internally used in the `_connect` and `_disconnect` methods.
@@ -1,14 +1,15 @@
 import logging
 
-import numpy as np
 from shapely.geometry.base import BaseGeometry
 
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.typing import Complex, Id, JsonDict
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow_engine.cy_engine import CyShuntLine, CySimplifiedLine
+from roseau.load_flow_single.constants import AMPERE, DIMENSIONLESS, KILOMETER, VOLT_AMPERE
 from roseau.load_flow_single.models.branches import AbstractBranch
 from roseau.load_flow_single.models.buses import Bus
+from roseau.load_flow_single.models.core import _engine_buffer
 from roseau.load_flow_single.models.lines.parameters import LineParameters
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 class Line(AbstractBranch):
     """An electrical line PI model with series impedance and optional shunt admittance."""
 
+    _is_galvanic = True
+
     def __init__(
         self,
         id: Id,
@@ -58,52 +61,48 @@ class Line(AbstractBranch):
         """
         self._initialized = False
         self._with_shunt = parameters.with_shunt
+        self._z_line_buffer = _engine_buffer()
+        self._y_shunt_buffer = _engine_buffer()
         super().__init__(id=id, bus1=bus1, bus2=bus2, n=1, geometry=geometry)
         self.length = length
         self.parameters = parameters
         self.max_loading = max_loading
         self._initialized = True
 
+        # Cache values used in results calculations
+        self._z_line = parameters._z_line.item() * self._length
+        self._y_shunt = parameters._y_shunt.item() * self._length
+        self._z_line_inv = 1.0 / self._z_line
+
+        self._z_line_buffer[0] = self._z_line
         if parameters.with_shunt:
-            self._cy_element = CyShuntLine(
-                n=1,
-                y_shunt=parameters._y_shunt.reshape(1) * self._length,
-                z_line=parameters._z_line.reshape(1) * self._length,
-            )
+            self._y_shunt_buffer[0] = self._y_shunt
+            self._cy_element = CyShuntLine(n=1, y_shunt=self._y_shunt_buffer, z_line=self._z_line_buffer)
         else:
-            self._cy_element = CySimplifiedLine(n=1, z_line=parameters._z_line.reshape(1) * self._length)
+            self._cy_element = CySimplifiedLine(n=1, z_line=self._z_line_buffer)
         self._cy_connect()
 
-        # Cache values used in results calculations
-        self._z_line = parameters._z_line[0][0] * self._length
-        self._y_shunt = parameters._y_shunt[0][0] * self._length
-        self._z_line_inv = 1.0 / self._z_line
-        self._yg = self._y_shunt  # y_ig = Y_ia + Y_ib + Y_ic + Y_in for i in {a, b, c, n}
-
     def _update_internal_parameters(self, parameters: LineParameters, length: float) -> None:
         """Update the internal parameters of the line."""
         self._parameters = parameters
         self._length = length
 
-        self._z_line = parameters._z_line[0][0] * length
-        self._y_shunt = parameters._y_shunt[0][0] * length
+        self._z_line = parameters._z_line.item() * length
+        self._y_shunt = parameters._y_shunt.item() * length
         self._z_line_inv = 1.0 / self._z_line
-        self._yg = self._y_shunt
 
         if self._cy_element is not None:
+            self._z_line_buffer[0] = self._z_line
             if self._parameters.with_shunt:
-                self._cy_element.update_line_parameters(
-                    y_shunt=np.array([self._y_shunt], dtype=np.complex128),
-                    z_line=np.array([self._z_line], dtype=np.complex128),
-                )
+                self._y_shunt_buffer[0] = self._y_shunt
+                self._cy_element.update_line_parameters(y_shunt=self._y_shunt_buffer, z_line=self._z_line_buffer)
             else:
-                self._cy_element.update_line_parameters(z_line=np.array([self._z_line], dtype=np.complex128))
+                self._cy_element.update_line_parameters(z_line=self._z_line_buffer)
 
     @property
-    @ureg_wraps("km", (None,))
     def length(self) -> Q_[float]:
         """The length of the line (in km)."""
-        return self._length
+        return Q_(self._length, KILOMETER)
 
     @length.setter
     @ureg_wraps(None, (None, "km"))
@@ -112,6 +111,8 @@ class Line(AbstractBranch):
             msg = f"A line length must be greater than 0. {value:.2f} km provided."
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE)
+        if self._initialized and value == self._length:
+            return  # Nothing changes, keep the engine parameters and the results
         self._invalidate_network_results()
         self._length = value
         if self._initialized:
@@ -124,6 +125,8 @@ class Line(AbstractBranch):
 
     @parameters.setter
     def parameters(self, value: LineParameters) -> None:
+        if self._initialized and value is self._parameters:
+            return  # The impedance and admittance of line parameters cannot be modified
         shape = (1, 1)
         if value._z_line.shape != shape:
             msg = f"Incorrect z_line dimensions for line {self.id!r}: {value._z_line.shape} instead of {shape}"
@@ -153,19 +156,18 @@ class Line(AbstractBranch):
     @ureg_wraps("ohm", (None,))
     def z_line(self) -> Q_[Complex]:
         """Impedance of the line (in Ohm)."""
-        return self._parameters._z_line[0][0] * self._length
+        return self._parameters._z_line.item() * self._length
 
     @property
     @ureg_wraps("S", (None,))
     def y_shunt(self) -> Q_[Complex]:
         """Shunt admittance of the line (in Siemens)."""
-        return self._parameters._y_shunt[0][0] * self._length
+        return self._parameters._y_shunt.item() * self._length
 
     @property
-    @ureg_wraps("", (None,))
     def max_loading(self) -> Q_[float]:
         """The maximum loading of the line (unitless)"""
-        return self._max_loading
+        return Q_(self._max_loading, DIMENSIONLESS)
 
     @max_loading.setter
     @ureg_wraps(None, (None, ""))
@@ -190,82 +192,92 @@ class Line(AbstractBranch):
         `ampacity` of the parameters."""
         # Do not add a setter. Only `max_loading` can be altered by the user
         amp = self._parameters._ampacities
-        return None if amp is None else Q_(amp[0] * self._max_loading, "A")
+        return None if amp is None else Q_(amp[0] * self._max_loading, AMPERE)
 
     @property
     def with_shunt(self) -> bool:
         return self._with_shunt
 
-    def _res_series_values_getter(self, warning: bool) -> tuple[Complex, Complex]:
-        pot1, pot2 = self._res_potentials_getter(warning)  # V
-        du_line = pot1 - pot2
+    def _res_series_values_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> tuple[Complex, Complex]:
+        if potential1 is None or potential2 is None:
+            potential1, potential2 = self._res_potentials_getter(warning)  # V
+        du_line = potential1 - potential2
         i_line = self._z_line_inv * du_line  # Zₗ x Iₗ = ΔU -> I = Zₗ⁻¹ x ΔU
         return du_line, i_line
 
-    def _res_series_currents_getter(self, warning: bool) -> Complex:
-        _, i_line = self._res_series_values_getter(warning)
+    def _res_series_currents_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> Complex:
+        _, i_line = self._res_series_values_getter(warning, potential1=potential1, potential2=potential2)
         return i_line
 
     @property
-    @ureg_wraps("A", (None,))
     def res_series_currents(self) -> Q_[Complex]:
         """Get the current in the series elements of the line (in A)."""
-        return self._res_series_currents_getter(warning=True)
+        return Q_(self._res_series_currents_getter(warning=True), AMPERE)
 
-    def _res_series_power_losses_getter(self, warning: bool) -> Complex:
-        du_line, i_line = self._res_series_values_getter(warning)
+    def _res_series_power_losses_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> Complex:
+        du_line, i_line = self._res_series_values_getter(warning, potential1=potential1, potential2=potential2)
         return du_line * i_line.conjugate() * 3.0  # Sₗ = ΔU.Iₗ*
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_series_power_losses(self) -> Q_[Complex]:
         """Get the power losses in the series elements of the line (in VA)."""
-        return self._res_series_power_losses_getter(warning=True)
+        return Q_(self._res_series_power_losses_getter(warning=True), VOLT_AMPERE)
 
-    def _res_shunt_values_getter(self, warning: bool) -> tuple[Complex, Complex, Complex, Complex]:
+    def _res_shunt_values_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> tuple[Complex, Complex, Complex, Complex]:
         assert self.with_shunt, "This method only works when there is a shunt"
-        pot1, pot2 = self._res_potentials_getter(warning)
-        vg = 0j
-        ig = self._yg * vg
-        i1_shunt = (self._y_shunt * pot1 - ig) / 2
-        i2_shunt = (self._y_shunt * pot2 - ig) / 2
-        return pot1, pot2, i1_shunt, i2_shunt
-
-    def _res_shunt_currents_getter(self, warning: bool) -> tuple[Complex, Complex]:
+        if potential1 is None or potential2 is None:
+            potential1, potential2 = self._res_potentials_getter(warning)
+        i1_shunt = self._y_shunt * potential1 / 2
+        i2_shunt = self._y_shunt * potential2 / 2
+        return potential1, potential2, i1_shunt, i2_shunt
+
+    def _res_shunt_currents_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> tuple[Complex, Complex]:
         if not self.with_shunt:
             return 0j, 0j
-        _, _, cur1, cur2 = self._res_shunt_values_getter(warning)
+        _, _, cur1, cur2 = self._res_shunt_values_getter(warning, potential1=potential1, potential2=potential2)
         return cur1, cur2
 
     @property
-    @ureg_wraps(("A", "A"), (None,))
     def res_shunt_currents(self) -> tuple[Q_[Complex], Q_[Complex]]:
         """Get the currents in the shunt elements of the line (in A)."""
         cur1, cur2 = self._res_shunt_currents_getter(warning=True)
-        return cur1, cur2
+        return Q_(cur1, AMPERE), Q_(cur2, AMPERE)
 
-    def _res_shunt_power_losses_getter(self, warning: bool) -> Complex:
+    def _res_shunt_power_losses_getter(
+        self, warning: bool, potential1: Complex | None = None, potential2: Complex | None = None
+    ) -> Complex:
         if not self.with_shunt:
             return 0j
-        pot1, pot2, cur1, cur2 = self._res_shunt_values_getter(warning)
+        pot1, pot2, cur1, cur2 = self._res_shunt_values_getter(warning, potential1=potential1, potential2=potential2)
         return (pot1 * cur1.conjugate() + pot2 * cur2.conjugate()) * 3.0
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_shunt_power_losses(self) -> Q_[Complex]:
         """Get the power losses in the shunt elements of the line (in VA)."""
-        return self._res_shunt_power_losses_getter(warning=True)
+        return Q_(self._res_shunt_power_losses_getter(warning=True), VOLT_AMPERE)
 
     def _res_power_losses_getter(self, warning: bool) -> Complex:
-        series_losses = self._res_series_power_losses_getter(warning)
-        shunt_losses = self._res_shunt_power_losses_getter(warning=False)  # we warn on the previous line
+        potential1, potential2 = self._res_potentials_getter(warning)  # fetched once for both losses
+        series_losses = self._res_series_power_losses_getter(
+            warning=False, potential1=potential1, potential2=potential2
+        )
+        shunt_losses = self._res_shunt_power_losses_getter(warning=False, potential1=potential1, potential2=potential2)
         return series_losses + shunt_losses
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_power_losses(self) -> Q_[Complex]:
         """Get the power losses in the line (in VA)."""
-        return self._res_power_losses_getter(warning=True)
+        return Q_(self._res_power_losses_getter(warning=True), VOLT_AMPERE)
 
     @property
     def res_loading(self) -> Q_[float] | None:
@@ -303,8 +315,8 @@ class Line(AbstractBranch):
             "params_id": self._parameters.id,
             "max_loading": self._max_loading,
         }
-        if self.geometry is not None:
-            res["geometry"] = self.geometry.__geo_interface__
+        if (geometry := self._geo_interface_getter()) is not None:
+            res["geometry"] = geometry
         if include_results:
             current1, current2 = self._res_currents_getter(warning=True)
             res["results"] = {
@@ -336,15 +348,22 @@ class Line(AbstractBranch):
             voltage1, voltage2 = self._res_voltages_getter(warning=False, potential1=potential1, potential2=potential2)
             results["voltage1"] = [voltage1.real, voltage1.imag]
             results["voltage2"] = [voltage2.real, voltage2.imag]
-            s = self._res_power_losses_getter(warning=False)
+            # The series and shunt quantities are derived from the potentials fetched above
+            i = self._res_series_currents_getter(warning=False, potential1=potential1, potential2=potential2)
+            series_losses = self._res_series_power_losses_getter(
+                warning=False, potential1=potential1, potential2=potential2
+            )
+            shunt_current1, shunt_current2 = self._res_shunt_currents_getter(
+                warning=False, potential1=potential1, potential2=potential2
+            )
+            shunt_losses = self._res_shunt_power_losses_getter(
+                warning=False, potential1=potential1, potential2=potential2
+            )
+            s = series_losses + shunt_losses
             results["power_losses"] = [s.real, s.imag]
-            i = self._res_series_currents_getter(warning=False)
             results["series_current"] = [i.real, i.imag]
-            s = self._res_series_power_losses_getter(warning=False)
-            results["series_power_loss"] = [s.real, s.imag]
-            shunt_current1, shunt_current2 = self._res_shunt_currents_getter(warning=False)
+            results["series_power_loss"] = [series_losses.real, series_losses.imag]
             results["shunt_current1"] = [shunt_current1.real, shunt_current1.imag]
             results["shunt_current2"] = [shunt_current2.real, shunt_current2.imag]
-            s = self._res_shunt_power_losses_getter(warning=False)
-            results["shunt_power_losses"] = [s.real, s.imag]
+            results["shunt_power_losses"] = [shunt_losses.real, shunt_losses.imag]
         return results
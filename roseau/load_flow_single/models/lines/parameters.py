@@ -1,11 +1,17 @@
 import logging
+from numbers import Number
 
-import numpy as np
-
+from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.models.lines.parameters import LineParameters as TriLineParameters
 from roseau.load_flow.typing import ComplexArrayLike2D, Id
-from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.units import Q_
 from roseau.load_flow.utils import Insulator, LineType, Material
+from roseau.load_flow_single.constants import (
+    AMPERE_CONTAINER,
+    OHM_PER_KM_CONTAINER,
+    SIEMENS_PER_KM_CONTAINER,
+    SQUARE_MILLIMETER_CONTAINER,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +19,6 @@ logger = logging.getLogger(__name__)
 class LineParameters(TriLineParameters):
     """Parameters that define electrical models of lines."""
 
-    @ureg_wraps(None, (None, None, "ohm/km", "S/km", "A", None, None, None, "mm²"))
     def __init__(
         self,
         id: Id,
@@ -60,8 +65,16 @@ class LineParameters(TriLineParameters):
                 automatically filled when the line parameters are created from a geometric model or
                 from the catalogue.
         """
-        z_line_tri = [[z_line]] if np.isscalar(z_line) else z_line
-        y_shunt_tri = [[y_shunt]] if y_shunt is not None and np.isscalar(y_shunt) else y_shunt
+        if isinstance(z_line, Q_):
+            z_line = z_line.m_as(OHM_PER_KM_CONTAINER)
+        if isinstance(y_shunt, Q_):
+            y_shunt = y_shunt.m_as(SIEMENS_PER_KM_CONTAINER)
+        if isinstance(ampacities, Q_):
+            ampacities = ampacities.m_as(AMPERE_CONTAINER)
+        if isinstance(sections, Q_):
+            sections = sections.m_as(SQUARE_MILLIMETER_CONTAINER)
+        z_line_tri = [[z_line]] if isinstance(z_line, Number) else z_line
+        y_shunt_tri = [[y_shunt]] if isinstance(y_shunt, Number) else y_shunt
         super().__init__(
             id,
             z_line=z_line_tri,
@@ -72,3 +85,20 @@ class LineParameters(TriLineParameters):
             insulators=insulators,
             sections=sections,
         )
+
+    def _check_matrix(self) -> None:
+        """Check the coefficients of the matrix."""
+        if self._z_line.shape != (1, 1) or self._y_shunt.shape != (1, 1):
+            return super()._check_matrix()
+
+        # The 1x1 matrices have no off-diagonal elements, only the sign of the real parts is checked
+        for value, matrix_name, code in (
+            (self._z_line.item(), "z_line", RoseauLoadFlowExceptionCode.BAD_Z_LINE_VALUE),
+            (self._y_shunt.item(), "y_shunt", RoseauLoadFlowExceptionCode.BAD_Y_SHUNT_VALUE),
+        ):
+            if matrix_name == "y_shunt" and not self._with_shunt:
+                continue
+            if value.real < 0.0:
+                msg = f"The {matrix_name} matrix of line type {self.id!r} has coefficients with negative real part."
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=code)
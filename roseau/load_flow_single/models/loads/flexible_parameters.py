@@ -7,12 +7,22 @@ from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowE
 from roseau.load_flow.models.loads.flexible_parameters import Control as TriControl
 from roseau.load_flow.models.loads.flexible_parameters import FlexibleParameter as TriFlexibleParameter
 from roseau.load_flow.models.loads.flexible_parameters import Projection
-from roseau.load_flow.typing import ComplexArray, ControlType, FloatArrayLike1D, ProjectionType
+from roseau.load_flow.typing import ComplexArray, ControlType, FloatArray, FloatArrayLike1D, ProjectionType
 from roseau.load_flow.units import Q_, ureg_wraps
 from roseau.load_flow_engine.cy_engine import CyControl, CyFlexibleParameter
+from roseau.load_flow_single.constants import (
+    SQRT3,
+    VOLT_AMPERE,
+    VOLT_AMPERE_CONTAINER,
+    VOLT_AMPERE_REACTIVE,
+    VOLT_AMPERE_REACTIVE_CONTAINER,
+)
 
 logger = logging.getLogger(__name__)
 
+# The number of voltages checked for repetitions before computing the flexible powers once per distinct voltage
+_REPETITIONS_SAMPLE_SIZE = 128
+
 
 class Control(TriControl):
     """Control class for flexible loads.
@@ -77,10 +87,10 @@ class Control(TriControl):
         super().__init__(type=type, u_min=u_min, u_down=u_down, u_up=u_up, u_max=u_max, alpha=alpha, epsilon=epsilon)
         self._cy_control = CyControl(
             t=self._type,
-            u_min=self._u_min / np.sqrt(3.0),
-            u_down=self._u_down / np.sqrt(3.0),
-            u_up=self._u_up / np.sqrt(3.0),
-            u_max=self._u_max / np.sqrt(3.0),
+            u_min=self._u_min / SQRT3,
+            u_down=self._u_down / SQRT3,
+            u_up=self._u_up / SQRT3,
+            u_max=self._u_max / SQRT3,
             alpha=self._alpha,
             epsilon=self._epsilon,
         )
@@ -142,18 +152,20 @@ class FlexibleParameter(TriFlexibleParameter):
             q_min=self._q_min / 3.0,
             q_max=self._q_max / 3.0,
         )
+        # Without any control, the engine returns the input power unchanged whatever the voltage
+        self._is_constant = control_p._type == "constant" and control_q._type == "constant"
 
     @property
-    @ureg_wraps("VA", (None,))
     def s_max(self) -> Q_[float]:
         """The apparent power of the flexible load (VA). It is the radius of the feasible circle."""
-        return self._s_max
+        return Q_(self._s_max, VOLT_AMPERE)
 
     @s_max.setter
-    @ureg_wraps(None, (None, "VA"))
     def s_max(self, value: float | Q_[float]) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_AMPERE_CONTAINER)
         if value <= 0:
-            s_max = Q_(value, "VA")
+            s_max = Q_(value, VOLT_AMPERE)
             msg = f"'s_max' must be greater than 0 but {s_max:P#~} was provided."
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
@@ -172,27 +184,27 @@ class FlexibleParameter(TriFlexibleParameter):
         return self._q_min_value if self._q_min_value is not None else -self._s_max
 
     @property
-    @ureg_wraps("VAr", (None,))
     def q_min(self) -> Q_[float]:
         """The minimum reactive power of the flexible load (VAr)."""
-        return self._q_min
+        return Q_(self._q_min, VOLT_AMPERE_REACTIVE)
 
     @q_min.setter
-    @ureg_wraps(None, (None, "VAr"))
     def q_min(self, value: float | Q_[float] | None) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_AMPERE_REACTIVE_CONTAINER)
         if value is not None:
             if value < -self._s_max:
-                q_min = Q_(value, "VAr")
+                q_min = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_min must be greater than -s_max ({-self.s_max:P#~}) but {q_min:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
             if value > self._s_max:
-                q_min = Q_(value, "VAr")
+                q_min = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_min must be lower than s_max ({self.s_max:P#~}) but {q_min:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
             if self._q_max_value is not None and value > self._q_max_value:
-                q_min = Q_(value, "VAr")
+                q_min = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_min must be lower than q_max ({self.q_max:P#~}) but {q_min:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
@@ -205,27 +217,27 @@ class FlexibleParameter(TriFlexibleParameter):
         return self._q_max_value if self._q_max_value is not None else self._s_max
 
     @property
-    @ureg_wraps("VAr", (None,))
     def q_max(self) -> Q_[float]:
         """The maximum reactive power of the flexible load (VAr)."""
-        return self._q_max
+        return Q_(self._q_max, VOLT_AMPERE_REACTIVE)
 
     @q_max.setter
-    @ureg_wraps(None, (None, "VAr"))
     def q_max(self, value: float | Q_[float] | None) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_AMPERE_REACTIVE_CONTAINER)
         if value is not None:
             if value > self._s_max:
-                q_max = Q_(value, "VAr")
+                q_max = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_max must be lower than s_max ({self.s_max:P#~}) but {q_max:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
             if value < -self._s_max:
-                q_max = Q_(value, "VAr")
+                q_max = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_max must be greater than -s_max ({-self.s_max:P#~}) but {q_max:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
             if self._q_min_value is not None and value < self._q_min_value:
-                q_max = Q_(value, "VAr")
+                q_max = Q_(value, VOLT_AMPERE_REACTIVE)
                 msg = f"q_max must be greater than q_min ({self.q_min:P#~}) but {q_max:P#~} was provided."
                 logger.error(msg)
                 raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_FLEXIBLE_PARAMETER_VALUE)
@@ -625,6 +637,23 @@ class FlexibleParameter(TriFlexibleParameter):
         )
 
     def _compute_powers(self, voltages: FloatArrayLike1D, power: complex) -> ComplexArray:
-        # Iterate over the provided voltages to get the associated flexible powers
-        res_flexible_powers = [self._cy_fp.compute_power(v / np.sqrt(3.0), power / 3.0) for v in voltages]
-        return np.array(res_flexible_powers, dtype=complex)
+        if self._is_constant:
+            return np.full(len(voltages), power / 3.0, dtype=np.complex128)
+        voltages = np.asarray(voltages, dtype=np.float64)
+        # Deduplicating costs a sort, it is only worth it for voltages that repeat (e.g. quantized measurements).
+        # The first voltages are checked for repetitions to avoid the sort when the voltages are all distinct.
+        sample = voltages[:_REPETITIONS_SAMPLE_SIZE]
+        if len(np.unique(sample)) < len(sample):
+            unique_voltages, inverse = np.unique(voltages, return_inverse=True)
+            return self._compute_phase_powers(unique_voltages, power)[inverse]
+        return self._compute_phase_powers(voltages, power)
+
+    def _compute_phase_powers(self, voltages: FloatArray, power: complex) -> ComplexArray:
+        """Call the engine once per voltage. The voltages are scaled to phase-to-neutral values in one go and
+        iterated as Python floats."""
+        compute_power = self._cy_fp.compute_power
+        phase_voltages = (voltages / SQRT3).tolist()
+        phase_power = power / 3.0
+        return np.fromiter(
+            (compute_power(v, phase_power) for v in phase_voltages), dtype=np.complex128, count=len(phase_voltages)
+        )
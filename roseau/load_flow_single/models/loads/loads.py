@@ -7,10 +7,21 @@ import numpy as np
 from roseau.load_flow import FlexibleParameter
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.typing import Complex, Id, JsonDict
-from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.units import Q_
 from roseau.load_flow_engine.cy_engine import CyAdmittanceLoad, CyCurrentLoad, CyFlexibleLoad, CyPowerLoad
+from roseau.load_flow_single.constants import (
+    AMPERE,
+    AMPERE_CONTAINER,
+    CONNECTIONS,
+    OHM,
+    OHM_CONTAINER,
+    SQRT3,
+    VOLT,
+    VOLT_AMPERE,
+    VOLT_AMPERE_CONTAINER,
+)
 from roseau.load_flow_single.models.buses import Bus
-from roseau.load_flow_single.models.core import Element
+from roseau.load_flow_single.models.core import Element, _engine_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +30,7 @@ class AbstractLoad(Element, ABC):
     """An abstract class of an electric load."""
 
     type: ClassVar[Literal["power", "current", "impedance"]]
+    _value_attr: ClassVar[str]
 
     def __init__(self, id: Id, bus: Bus) -> None:
         """AbstractLoad constructor.
@@ -58,8 +70,8 @@ class AbstractLoad(Element, ABC):
         return False
 
     def _refresh_results(self) -> None:
-        self._res_current = self._cy_element.get_currents(self._n)[0]
-        self._res_potential = self._cy_element.get_potentials(self._n)[0]
+        self._res_current = self._cy_element.get_currents(self._n).item(0)
+        self._res_potential = self._cy_element.get_potentials(self._n).item(0)
 
     def _res_current_getter(self, warning: bool) -> Complex:
         if self._fetch_results:
@@ -67,14 +79,13 @@ class AbstractLoad(Element, ABC):
         return self._res_getter(value=self._res_current, warning=warning)
 
     @property
-    @ureg_wraps("A", (None,))
     def res_current(self) -> Q_[Complex]:
         """The load flow result of the load currents (A)."""
-        return self._res_current_getter(warning=True)
+        return Q_(self._res_current_getter(warning=True), AMPERE)
 
     def _validate_value(self, value: Complex) -> Complex:
-        # A load cannot have any zero impedance
-        if self.type == "impedance" and np.isclose(value, 0).any():
+        # A load cannot have any zero impedance (same tolerance as `np.isclose(value, 0)`)
+        if self.type == "impedance" and abs(value) <= 1e-8:
             msg = f"An impedance of the load {self.id!r} is null"
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_Z_VALUE)
@@ -86,13 +97,12 @@ class AbstractLoad(Element, ABC):
         return self._res_getter(value=self._res_potential, warning=warning)
 
     def _res_voltage_getter(self, warning: bool) -> Complex:
-        return self._res_potential_getter(warning) * np.sqrt(3.0)
+        return self._res_potential_getter(warning) * SQRT3
 
     @property
-    @ureg_wraps("V", (None,))
     def res_voltage(self) -> Q_[Complex]:
         """The load flow result of the load voltages (V)."""
-        return self._res_voltage_getter(warning=True)
+        return Q_(self._res_voltage_getter(warning=True), VOLT)
 
     def _res_power_getter(
         self, warning: bool, current: Complex | None = None, potential: Complex | None = None
@@ -105,16 +115,12 @@ class AbstractLoad(Element, ABC):
         return potential * current.conjugate() * 3.0
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_power(self) -> Q_[Complex]:
         """The load flow result of the "line powers" flowing into the load (VA)."""
-        return self._res_power_getter(warning=True)
+        return Q_(self._res_power_getter(warning=True), VOLT_AMPERE)
 
     def _cy_connect(self):
-        connections = []
-        for i in range(self._n):
-            connections.append((i, i))
-        self.bus._cy_element.connect(self._cy_element, connections)
+        self.bus._cy_element.connect(self._cy_element, CONNECTIONS)
 
     #
     # Disconnect
@@ -163,13 +169,11 @@ class AbstractLoad(Element, ABC):
             msg = f"Unknown load type {load_type!r} for load {data['id']!r}"
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE)
-        if include_results and "results" in data:
-            self._res_current = complex(data["results"]["current"][0], data["results"]["current"][1])
-            self._res_potential = complex(data["results"]["potential"][0], data["results"]["potential"][1])
-            if "flexible_power" in data["results"]:
-                self._res_flexible_power = complex(
-                    data["results"]["flexible_power"][0], data["results"]["flexible_power"][1]
-                )
+        if include_results and (results := data.get("results")) is not None:
+            self._res_current = complex(results["current"][0], results["current"][1])
+            self._res_potential = complex(results["potential"][0], results["potential"][1])
+            if (flexible_power := results.get("flexible_power")) is not None:
+                self._res_flexible_power = complex(flexible_power[0], flexible_power[1])
 
             self._fetch_results = False
             self._no_results = False
@@ -177,12 +181,12 @@ class AbstractLoad(Element, ABC):
 
     def _to_dict(self, include_results: bool) -> JsonDict:
         self._raise_disconnected_error()
-        complex_value = getattr(self, f"_{self.type}")
+        complex_value = getattr(self, self._value_attr)
         res = {
             "id": self.id,
             "bus": self.bus.id,
             "type": self.type,
-            f"{self.type}": [complex_value.real, complex_value.imag],
+            self.type: [complex_value.real, complex_value.imag],
         }
         if include_results:
             current = self._res_current_getter(warning=True)
@@ -210,6 +214,7 @@ class PowerLoad(AbstractLoad):
     """A constant power load."""
 
     type: Final = "power"
+    _value_attr: Final = "_power"
 
     def __init__(
         self, id: Id, bus: Bus, *, power: Complex | Q_[Complex], flexible_param: FlexibleParameter | None = None
@@ -234,16 +239,19 @@ class PowerLoad(AbstractLoad):
         super().__init__(id=id, bus=bus)
 
         self._flexible_param = flexible_param
+        # The power limits of the flexible parameter only apply when there is a control
+        self._check_flexible_power = flexible_param is not None and (
+            flexible_param.control_p.type != "constant" or flexible_param.control_q.type != "constant"
+        )
+        self._powers_buffer = _engine_buffer()
         self.power = power
         self._res_flexible_power: Complex | None = None
 
         if self.is_flexible:
             cy_parameters = np.array([flexible_param._cy_fp])  # type: ignore
-            self._cy_element = CyFlexibleLoad(
-                n=self._n, powers=np.array([self._power / 3.0], dtype=np.complex128), parameters=cy_parameters
-            )
+            self._cy_element = CyFlexibleLoad(n=self._n, powers=self._powers_buffer, parameters=cy_parameters)
         else:
-            self._cy_element = CyPowerLoad(n=self._n, powers=np.array([self._power / 3.0], dtype=np.complex128))
+            self._cy_element = CyPowerLoad(n=self._n, powers=self._powers_buffer)
         self._cy_connect()
 
     @property
@@ -255,45 +263,46 @@ class PowerLoad(AbstractLoad):
         return self._flexible_param is not None
 
     @property
-    @ureg_wraps("VA", (None,))
     def power(self) -> Q_[Complex]:
         """The power of the load (VA).
 
         Setting the power will update the load's power values and invalidate the network results.
         """
-        return self._power
+        return Q_(self._power, VOLT_AMPERE)
 
     @power.setter
-    @ureg_wraps(None, (None, "VA"))
     def power(self, value: Complex) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_AMPERE_CONTAINER)
         value = self._validate_value(value)
-        if self._flexible_param is not None:
+        if self._check_flexible_power:
             power, fp = value, self._flexible_param
-            if fp.control_p.type != "constant" or fp.control_q.type != "constant":
-                if abs(power) > fp._s_max:
-                    msg = f"The power is greater than the parameter s_max for flexible load {self.id!r}"
-                    logger.error(msg)
-                    raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
-                if power.imag < fp._q_min:
-                    msg = f"The reactive power is lower than the parameter q_min for flexible load {self.id!r}"
-                    logger.error(msg)
-                    raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
-                if power.imag > fp._q_max:
-                    msg = f"The reactive power is greater than the parameter q_max for flexible load {self.id!r}"
-                    logger.error(msg)
-                    raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
-                if fp.control_p.type == "p_max_u_production" and power.real > 0:
-                    msg = f"There is a production control but a positive power for flexible load {self.id!r}"
-                    logger.error(msg)
-                    raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
-                if fp.control_p.type == "p_max_u_consumption" and power.real < 0:
-                    msg = f"There is a consumption control but a negative power for flexible load {self.id!r}"
-                    logger.error(msg)
-                    raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
+            p_type = fp.control_p.type
+            if abs(power) > fp._s_max:
+                msg = f"The power is greater than the parameter s_max for flexible load {self.id!r}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
+            if power.imag < fp._q_min:
+                msg = f"The reactive power is lower than the parameter q_min for flexible load {self.id!r}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
+            if power.imag > fp._q_max:
+                msg = f"The reactive power is greater than the parameter q_max for flexible load {self.id!r}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
+            if p_type == "p_max_u_production" and power.real > 0:
+                msg = f"There is a production control but a positive power for flexible load {self.id!r}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
+            if p_type == "p_max_u_consumption" and power.real < 0:
+                msg = f"There is a consumption control but a negative power for flexible load {self.id!r}"
+                logger.error(msg)
+                raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_S_VALUE)
         self._power = value
+        self._powers_buffer[0] = value / 3.0
         self._invalidate_network_results()
         if self._cy_element is not None:
-            self._cy_element.update_powers(np.array([self._power / 3.0], dtype=np.complex128))
+            self._cy_element.update_powers(self._powers_buffer)
 
     def _refresh_results(self) -> None:
         super()._refresh_results()
@@ -306,7 +315,6 @@ class PowerLoad(AbstractLoad):
         return self._res_getter(value=self._res_flexible_power, warning=warning)
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_flexible_power(self) -> Q_[Complex]:
         """The load flow result of the load flexible powers (VA).
 
@@ -321,7 +329,7 @@ class PowerLoad(AbstractLoad):
             msg = f"The load {self.id!r} is not flexible and does not have flexible powers"
             logger.error(msg)
             raise RoseauLoadFlowException(msg=msg, code=RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE)
-        return self._res_flexible_power_getter(warning=True)
+        return Q_(self._res_flexible_power_getter(warning=True), VOLT_AMPERE)
 
     #
     # Json Mixin interface
@@ -350,6 +358,7 @@ class CurrentLoad(AbstractLoad):
     """A constant current load."""
 
     type: Final = "current"
+    _value_attr: Final = "_current"
 
     def __init__(self, id: Id, bus: Bus, *, current: Complex | Q_[Complex]) -> None:
         """CurrentLoad constructor.
@@ -371,17 +380,17 @@ class CurrentLoad(AbstractLoad):
         self._cy_connect()
 
     @property
-    @ureg_wraps("A", (None,))
     def current(self) -> Q_[Complex]:
         """The current of the load (Amps).
 
         Setting the current will update the load's current and invalidate the network results.
         """
-        return self._current
+        return Q_(self._current, AMPERE)
 
     @current.setter
-    @ureg_wraps(None, (None, "A"))
     def current(self, value: Complex) -> None:
+        if isinstance(value, Q_):
+            value = value.m_as(AMPERE_CONTAINER)
         self._current = self._validate_value(value)
         self._invalidate_network_results()
         if self._cy_element is not None:
@@ -392,6 +401,7 @@ class ImpedanceLoad(AbstractLoad):
     """A constant impedance load."""
 
     type: Final = "impedance"
+    _value_attr: Final = "_impedance"
 
     def __init__(self, id: Id, bus: Bus, *, impedance: Complex | Q_[Complex]) -> None:
         """ImpedanceLoad constructor.
@@ -415,14 +425,14 @@ class ImpedanceLoad(AbstractLoad):
         self._cy_connect()
 
     @property
-    @ureg_wraps("ohm", (None,))
     def impedance(self) -> Q_[Complex]:
         """The impedance of the load (Ohms)."""
-        return self._impedance
+        return Q_(self._impedance, OHM)
 
     @impedance.setter
-    @ureg_wraps(None, (None, "ohm"))
     def impedance(self, impedance: Complex) -> None:
+        if isinstance(impedance, Q_):
+            impedance = impedance.m_as(OHM_CONTAINER)
         self._impedance = self._validate_value(impedance)
         self._invalidate_network_results()
         if self._cy_element is not None:
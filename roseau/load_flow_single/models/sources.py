@@ -1,14 +1,14 @@
 import logging
 
-import numpy as np
 from typing_extensions import Self
 
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow.models.buses import Bus
 from roseau.load_flow.typing import Complex, Id, JsonDict
-from roseau.load_flow.units import Q_, ureg_wraps
+from roseau.load_flow.units import Q_
 from roseau.load_flow_engine.cy_engine import CyVoltageSource
-from roseau.load_flow_single.models.core import Element
+from roseau.load_flow_single.constants import AMPERE, CONNECTIONS, SQRT3, VOLT, VOLT_AMPERE, VOLT_CONTAINER
+from roseau.load_flow_single.models.core import Element, _engine_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +46,9 @@ class VoltageSource(Element):
         self._connect(bus)
         self._bus = bus
         self._n = 2
+        self._voltages_buffer = _engine_buffer()
         self.voltage = voltage
-        self._cy_element = CyVoltageSource(
-            n=self._n, voltages=np.array([self._voltage / np.sqrt(3.0)], dtype=np.complex128)
-        )
+        self._cy_element = CyVoltageSource(n=self._n, voltages=self._voltages_buffer)
         self._cy_connect()
 
         # Results
@@ -66,26 +65,27 @@ class VoltageSource(Element):
         return self._bus
 
     @property
-    @ureg_wraps("V", (None,))
     def voltage(self) -> Q_[Complex]:
         """The complex voltage of the source (V).
 
         Setting the voltage will update the source voltage and invalidate the network results.
         """
-        return self._voltage
+        return Q_(self._voltage, VOLT)
 
     @voltage.setter
-    @ureg_wraps(None, (None, "V"))
     def voltage(self, value: Complex) -> None:
         """Set the voltages of the source."""
+        if isinstance(value, Q_):
+            value = value.m_as(VOLT_CONTAINER)
         self._voltage = value
+        self._voltages_buffer[0] = value / SQRT3
         self._invalidate_network_results()
         if self._cy_element is not None:
-            self._cy_element.update_voltages(np.array([self._voltage / np.sqrt(3.0)], dtype=np.complex128))
+            self._cy_element.update_voltages(self._voltages_buffer)
 
     def _refresh_results(self) -> None:
-        self._res_current = self._cy_element.get_currents(self._n)[0]
-        self._res_potential = self._cy_element.get_potentials(self._n)[0]
+        self._res_current = self._cy_element.get_currents(self._n).item(0)
+        self._res_potential = self._cy_element.get_potentials(self._n).item(0)
 
     def _res_current_getter(self, warning: bool) -> Complex:
         if self._fetch_results:
@@ -93,10 +93,9 @@ class VoltageSource(Element):
         return self._res_getter(value=self._res_current, warning=warning)
 
     @property
-    @ureg_wraps("A", (None,))
     def res_current(self) -> Q_[Complex]:
         """The load flow result of the source currents (A)."""
-        return self._res_current_getter(warning=True)
+        return Q_(self._res_current_getter(warning=True), AMPERE)
 
     def _res_potential_getter(self, warning: bool) -> Complex:
         if self._fetch_results:
@@ -104,13 +103,12 @@ class VoltageSource(Element):
         return self._res_getter(value=self._res_potential, warning=warning)
 
     def _res_voltage_getter(self, warning: bool) -> Complex:
-        return self._res_potential_getter(warning) * np.sqrt(3.0)
+        return self._res_potential_getter(warning) * SQRT3
 
     @property
-    @ureg_wraps("V", (None,))
     def res_voltage(self) -> Q_[Complex]:
         """The load flow result of the source voltages (V)."""
-        return self._res_voltage_getter(warning=True)
+        return Q_(self._res_voltage_getter(warning=True), VOLT)
 
     def _res_power_getter(
         self, warning: bool, current: Complex | None = None, potential: Complex | None = None
@@ -123,16 +121,12 @@ class VoltageSource(Element):
         return potential * current.conjugate() * 3.0
 
     @property
-    @ureg_wraps("VA", (None,))
     def res_power(self) -> Q_[Complex]:
         """The load flow result of the source powers (VA)."""
-        return self._res_power_getter(warning=True)
+        return Q_(self._res_power_getter(warning=True), VOLT_AMPERE)
 
     def _cy_connect(self):
-        connections = []
-        for i in range(self._n):
-            connections.append((i, i))
-        self.bus._cy_element.connect(self._cy_element, connections)
+        self.bus._cy_element.connect(self._cy_element, CONNECTIONS)
 
     #
     # Disconnect
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class Switch(AbstractBranch):
     """A general purpose switch branch."""
 
+    _is_galvanic = True
+
     def __init__(self, id: Id, bus1: Bus, bus2: Bus, *, geometry: BaseGeometry | None = None) -> None:
         """Switch constructor.
 
@@ -78,8 +80,8 @@ class Switch(AbstractBranch):
     #
     def _to_dict(self, include_results: bool) -> JsonDict:
         res = {"id": self.id, "bus1": self.bus1.id, "bus2": self.bus2.id}
-        if self.geometry is not None:
-            res["geometry"] = self.geometry.__geo_interface__
+        if (geometry := self._geo_interface_getter()) is not None:
+            res["geometry"] = geometry
         if include_results:
             current1, current2 = self._res_currents_getter(warning=True)
             res["results"] = {
@@ -1,4 +1,5 @@
 import numpy as np
+from shapely import GeometryCollection, LineString, Point
 
 from roseau.load_flow_single import Bus, Line, LineParameters
 
@@ -24,3 +25,24 @@ def test_powers_equal(network_with_results):
     assert np.allclose(power1, -vs.res_power)
     assert np.allclose(power2, -pl.res_power)
     assert np.allclose(power1 + power2, line.res_power_losses)
+
+
+def test_branches_geometry_to_dict():
+    bus1 = Bus("bus1")
+    bus2 = Bus("bus2")
+    lp = LineParameters("lp", z_line=1)
+    line = Line("line", bus1, bus2, length=1, parameters=lp, geometry=LineString([(0, 0), (1, 1)]))
+    assert line.to_dict(include_results=False)["geometry"] == {"type": "LineString", "coordinates": ((0, 0), (1, 1))}
+
+    # Modifying the serialized data does not modify the branch
+    line.to_dict(include_results=False)["geometry"]["type"] = "Corrupted"
+    assert line.to_dict(include_results=False)["geometry"] == {"type": "LineString", "coordinates": ((0, 0), (1, 1))}
+    line.geometry = GeometryCollection([Point(0, 0), LineString([(0, 0), (1, 1)])])
+    line.to_dict(include_results=False)["geometry"]["geometries"][0]["type"] = "Corrupted"
+    assert line.to_dict(include_results=False)["geometry"]["geometries"][0]["type"] == "Point"
+
+    # Changing the geometry updates the serialized data
+    line.geometry = Point(1, 1)
+    assert line.to_dict(include_results=False)["geometry"] == {"type": "Point", "coordinates": (1.0, 1.0)}
+    line.geometry = None
+    assert "geometry" not in line.to_dict(include_results=False)
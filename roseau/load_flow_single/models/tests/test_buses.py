@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import pytest
+from shapely import Point
 
 from roseau.load_flow import Q_, RoseauLoadFlowException, RoseauLoadFlowExceptionCode
 from roseau.load_flow_single import (
@@ -129,6 +130,21 @@ def test_voltage_limits():
     assert e.value.msg == "The nominal voltage of bus 'bus' must be positive. -400 V has been provided."
 
 
+def test_bus_geometry_to_dict():
+    bus = Bus(id="bus", geometry=Point(1, 2))
+    assert bus.to_dict(include_results=False)["geometry"] == {"type": "Point", "coordinates": (1.0, 2.0)}
+
+    # Modifying the serialized data does not modify the bus
+    bus.to_dict(include_results=False)["geometry"]["type"] = "Corrupted"
+    assert bus.to_dict(include_results=False)["geometry"] == {"type": "Point", "coordinates": (1.0, 2.0)}
+
+    # Changing the geometry updates the serialized data
+    bus.geometry = Point(3, 4)
+    assert bus.to_dict(include_results=False)["geometry"] == {"type": "Point", "coordinates": (3.0, 4.0)}
+    bus.geometry = None
+    assert "geometry" not in bus.to_dict(include_results=False)
+
+
 def test_res_voltages():
     bus = Bus(id="bus")
     bus._res_potential = 230 + 0j
@@ -536,3 +536,37 @@ def test_flexible_parameters_compute_powers():
         voltages=voltages, power=power, voltages_labels_mask=np.isin(voltages, [240 * np.sqrt(3.0), 250 * np.sqrt(3.0)])
     )
     np.testing.assert_allclose(res_flexible_powers.m, expected_res_flexible_powers)
+
+
+def test_flexible_parameters_compute_powers_repeated_voltages():
+    fp = FlexibleParameter.q_u(
+        u_min=Q_(210, "V"), u_down=Q_(220, "V"), u_up=Q_(240, "V"), u_max=Q_(245, "V"), s_max=Q_(15, "kVA")
+    )
+    power = 5e3 - 1e3j
+    # Repeated and unsorted voltages are computed once per distinct value and returned in the input order
+    voltages = np.array([245.0, 215.0, 230.0, 215.0, 250.0, 245.0, 205.0, 230.0, 215.0])
+    res_flexible_powers = fp.compute_powers(voltages=voltages, power=power)
+    expected = [fp._cy_fp.compute_power(v / np.sqrt(3.0), power / 3.0) for v in voltages]
+    np.testing.assert_array_equal(res_flexible_powers.m_as("VA"), expected)
+
+    # Distinct voltages are computed one by one
+    voltages = np.array([245.0, 215.0, 230.0, 250.0, 205.0])
+    res_flexible_powers = fp.compute_powers(voltages=voltages, power=power)
+    expected = [fp._cy_fp.compute_power(v / np.sqrt(3.0), power / 3.0) for v in voltages]
+    np.testing.assert_array_equal(res_flexible_powers.m_as("VA"), expected)
+
+
+def test_constant_flexible_parameters_compute_powers():
+    fp = FlexibleParameter(
+        control_p=Control.constant(),
+        control_q=Control.constant(),
+        projection=Projection(type="euclidean"),
+        s_max=Q_(1, "kVA"),
+    )
+    voltages = np.array([100.0, 230.0, 400.0])
+    power = 5e3 - 3e3j
+    res_flexible_powers = fp.compute_powers(voltages=voltages, power=power)
+    # The same results as the engine, the power is not limited by s_max without control
+    expected = [fp._cy_fp.compute_power(v / np.sqrt(3.0), power / 3.0) for v in voltages]
+    np.testing.assert_allclose(res_flexible_powers.m_as("VA"), expected)
+    np.testing.assert_allclose(res_flexible_powers.m_as("VA"), power / 3.0)
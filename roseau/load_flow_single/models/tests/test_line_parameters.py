@@ -791,6 +791,30 @@ def test_json_serialization(tmp_path):
     npt.assert_allclose(lp_dict["ampacities"], [1, np.nan, np.nan])
 
 
+def test_from_dict():
+    lp = LineParameters(
+        id="test",
+        z_line=Q_(0.1 + 0.2j, "ohm/m"),
+        y_shunt=1e-6j,
+        ampacities=Q_(0.2, "kA"),
+        line_type=LineType.UNDERGROUND,
+        materials=Material.AL,
+        insulators=Insulator.PVC,
+        sections=150,
+    )
+    lp2 = LineParameters.from_dict(lp.to_dict())
+    assert isinstance(lp2, LineParameters)
+    assert lp2 == lp
+    npt.assert_allclose(lp2.z_line.m_as("ohm/km"), [[100 + 200j]])
+    npt.assert_allclose(lp2.ampacities.m_as("A"), [200])
+
+    # Without shunt
+    lp = LineParameters(id="test", z_line=0.1 + 0.2j)
+    lp2 = LineParameters.from_dict(lp.to_dict())
+    assert lp2 == lp
+    assert not lp2.with_shunt
+
+
 def test_from_open_dss():
     # DSS command: `New linecode.240sq nphases=3 R1=0.127 X1=0.072 R0=0.342 X0=0.089 units=km`
     lp240sq = LineParameters.from_open_dss(
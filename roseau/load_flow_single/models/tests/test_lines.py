@@ -38,6 +38,20 @@ def test_lines_length():
     assert e.value.args[1] == RoseauLoadFlowExceptionCode.BAD_LENGTH_VALUE
 
 
+def test_lines_same_length(network_with_results):
+    line = network_with_results.lines["line"]
+    assert network_with_results._results_valid
+
+    # Setting the same length or parameters keeps the results
+    line.length = line.length
+    line.parameters = line.parameters
+    assert network_with_results._results_valid
+
+    # A new length invalidates them
+    line.length = line._length * 2
+    assert not network_with_results._results_valid
+
+
 def test_lines_units():
     bus1 = Bus(id="bus1")
     bus2 = Bus(id="bus2")
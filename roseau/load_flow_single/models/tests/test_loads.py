@@ -197,3 +197,17 @@ def test_non_flexible_load_res_flexible_powers():
         _ = load.res_flexible_power
     assert e.value.msg == "The load 'load' is not flexible and does not have flexible powers"
     assert e.value.code == RoseauLoadFlowExceptionCode.BAD_LOAD_TYPE
+
+
+def test_null_impedance_load():
+    bus = Bus(id="bus")
+    with pytest.raises(RoseauLoadFlowException) as e:
+        ImpedanceLoad(id="load", bus=bus, impedance=1e-9j)
+    assert e.value.msg == "An impedance of the load 'load' is null"
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_Z_VALUE
+
+    load = ImpedanceLoad(id="load", bus=bus, impedance=1e-6)
+    with pytest.raises(RoseauLoadFlowException) as e:
+        load.impedance = Q_(0.0, "ohm")
+    assert e.value.msg == "An impedance of the load 'load' is null"
+    assert e.value.code == RoseauLoadFlowExceptionCode.BAD_Z_VALUE
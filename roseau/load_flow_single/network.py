@@ -6,9 +6,10 @@ import logging
 import textwrap
 import time
 import warnings
-from collections.abc import Mapping, Sized
+from collections.abc import Collection, Mapping, Sized
 from itertools import chain
 from numbers import Complex
+from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn, TypeVar
 
 import geopandas as gpd
@@ -19,11 +20,13 @@ from typing_extensions import Self
 
 from roseau.load_flow._solvers import AbstractSolver
 from roseau.load_flow.exceptions import RoseauLoadFlowException, RoseauLoadFlowExceptionCode
-from roseau.load_flow.typing import Id, JsonDict, MapOrSeq, Solver
+from roseau.load_flow.typing import ComplexArray, Id, JsonDict, MapOrSeq, Solver, StrPath
 from roseau.load_flow.utils import JsonMixin, _optional_deps
 from roseau.load_flow.utils.types import _DTYPES, LoadTypeDtype
 from roseau.load_flow_engine.cy_engine import CyElectricalNetwork, CyGround, CyPotentialRef
+from roseau.load_flow_single.constants import SQRT3
 from roseau.load_flow_single.io import network_from_dict, network_to_dict
+from roseau.load_flow_single.io._json import json_dump, json_load
 from roseau.load_flow_single.models import Transformer
 from roseau.load_flow_single.models.branches import AbstractBranch
 from roseau.load_flow_single.models.buses import Bus
@@ -575,47 +578,40 @@ class ElectricalNetwork(JsonMixin):
             - `nominal_voltage`: The nominal voltage of the bus (in Volts).
         """
         self._check_valid_results()
+        buses = self.buses.values()
+        n = len(buses)
+        voltages = self._gather_buses_voltages(buses, warning=False)
+        nan = float("nan")
+        nominal_voltages = np.fromiter(
+            (nan if bus._nominal_voltage is None else bus._nominal_voltage for bus in buses), dtype=np.float64, count=n
+        )
+        min_voltage_levels = np.fromiter(
+            (nan if bus._min_voltage_level is None else bus._min_voltage_level for bus in buses),
+            dtype=np.float64,
+            count=n,
+        )
+        max_voltage_levels = np.fromiter(
+            (nan if bus._max_voltage_level is None else bus._max_voltage_level for bus in buses),
+            dtype=np.float64,
+            count=n,
+        )
+        # The levels and violations are only defined for the buses with a nominal voltage and a limit
+        voltage_limits_set = ~np.isnan(nominal_voltages) & ~(
+            np.isnan(min_voltage_levels) & np.isnan(max_voltage_levels)
+        )
+        voltage_levels = np.where(voltage_limits_set, np.abs(voltages) / nominal_voltages, nan)
+        violated = (voltage_levels < min_voltage_levels) | (voltage_levels > max_voltage_levels)
         voltages_dict = {
-            "bus_id": [],
-            "voltage": [],
-            "violated": [],
-            "voltage_level": [],
+            "bus_id": list(self.buses),
+            "voltage": voltages,
+            "violated": pd.arrays.BooleanArray(violated, mask=~voltage_limits_set),
+            "voltage_level": voltage_levels,
             # Non results
-            "min_voltage_level": [],
-            "max_voltage_level": [],
-            "nominal_voltage": [],
+            "min_voltage_level": min_voltage_levels,
+            "max_voltage_level": max_voltage_levels,
+            "nominal_voltage": nominal_voltages,
         }
         dtypes = {c: _DTYPES[c] for c in voltages_dict}
-        for bus_id, bus in self.buses.items():
-            nominal_voltage = bus._nominal_voltage
-            min_voltage_level = bus._min_voltage_level
-            max_voltage_level = bus._max_voltage_level
-            voltage_limits_set = (
-                min_voltage_level is not None or max_voltage_level is not None
-            ) and nominal_voltage is not None
-
-            if nominal_voltage is None:
-                nominal_voltage = float("nan")
-            if min_voltage_level is None:
-                min_voltage_level = float("nan")
-            if max_voltage_level is None:
-                max_voltage_level = float("nan")
-            voltage = bus._res_voltage_getter(warning=False)
-            if voltage_limits_set:
-                voltage_abs = abs(voltage)
-                voltage_level = voltage_abs / nominal_voltage
-                violated = voltage_level < min_voltage_level or voltage_level > max_voltage_level
-            else:
-                violated = None
-                voltage_level = float("nan")
-            voltages_dict["bus_id"].append(bus_id)
-            voltages_dict["voltage"].append(voltage)
-            voltages_dict["violated"].append(violated)
-            voltages_dict["voltage_level"].append(voltage_level)
-            # Non results
-            voltages_dict["min_voltage_level"].append(min_voltage_level)
-            voltages_dict["max_voltage_level"].append(max_voltage_level)
-            voltages_dict["nominal_voltage"].append(nominal_voltage)
         return pd.DataFrame(voltages_dict).astype(dtypes).set_index("bus_id")
 
     @property
@@ -692,8 +688,8 @@ class ElectricalNetwork(JsonMixin):
             res_dict["current2"].append(current2)
             res_dict["power1"].append(power1)
             res_dict["power2"].append(power2)
-            res_dict["voltage1"].append(potential1 * np.sqrt(3.0))
-            res_dict["voltage2"].append(potential2 * np.sqrt(3.0))
+            res_dict["voltage1"].append(potential1 * SQRT3)
+            res_dict["voltage2"].append(potential2 * SQRT3)
             res_dict["series_losses"].append(series_loss)
             res_dict["series_current"].append(series_current)
             res_dict["loading"].append(loading)
@@ -754,8 +750,8 @@ class ElectricalNetwork(JsonMixin):
             res_dict["current2"].append(current2)
             res_dict["power1"].append(power1)
             res_dict["power2"].append(power2)
-            res_dict["voltage1"].append(potential1 * np.sqrt(3.0))
-            res_dict["voltage2"].append(potential2 * np.sqrt(3.0))
+            res_dict["voltage1"].append(potential1 * SQRT3)
+            res_dict["voltage2"].append(potential2 * SQRT3)
             res_dict["violated"].append(violated)
             res_dict["loading"].append(loading)
             # Non results
@@ -801,8 +797,8 @@ class ElectricalNetwork(JsonMixin):
             res_dict["current2"].append(current2)
             res_dict["power1"].append(power1)
             res_dict["power2"].append(power2)
-            res_dict["voltage1"].append(potential1 * np.sqrt(3.0))
-            res_dict["voltage2"].append(potential2 * np.sqrt(3.0))
+            res_dict["voltage1"].append(potential1 * SQRT3)
+            res_dict["voltage2"].append(potential2 * SQRT3)
         return pd.DataFrame(res_dict).astype(dtypes).set_index("switch_id")
 
     @property
@@ -819,17 +815,16 @@ class ElectricalNetwork(JsonMixin):
             - `voltage`: The complex voltage of the load (in Volts).
         """
         self._check_valid_results()
-        res_dict = {"load_id": [], "type": [], "current": [], "power": [], "voltage": []}
+        loads = self.loads.values()
+        currents, potentials = self._gather_currents_and_potentials(loads, warning=False)
+        res_dict = {
+            "load_id": list(self.loads),
+            "type": [load.type for load in loads],
+            "current": currents,
+            "power": potentials * currents.conj() * 3.0,
+            "voltage": potentials * SQRT3,
+        }
         dtypes = {c: _DTYPES[c] for c in res_dict} | {"type": LoadTypeDtype}
-        for load_id, load in self.loads.items():
-            current = load._res_current_getter(warning=False)
-            potential = load._res_potential_getter(warning=False)
-            power = potential * current.conjugate() * 3.0
-            res_dict["load_id"].append(load_id)
-            res_dict["type"].append(load.type)
-            res_dict["current"].append(current)
-            res_dict["power"].append(power)
-            res_dict["voltage"].append(potential * np.sqrt(3.0))
         return pd.DataFrame(res_dict).astype(dtypes).set_index("load_id")
 
     @property
@@ -870,16 +865,14 @@ class ElectricalNetwork(JsonMixin):
             - `voltage`: The complex voltage of the source (in Volts).
         """
         self._check_valid_results()
-        res_dict = {"source_id": [], "current": [], "power": [], "voltage": []}
+        currents, potentials = self._gather_currents_and_potentials(self.sources.values(), warning=False)
+        res_dict = {
+            "source_id": list(self.sources),
+            "current": currents,
+            "power": potentials * currents.conj() * 3.0,
+            "voltage": potentials * SQRT3,
+        }
         dtypes = {c: _DTYPES[c] for c in res_dict}
-        for source_id, source in self.sources.items():
-            current = source._res_current_getter(warning=False)
-            potential = source._res_potential_getter(warning=False)
-            power = potential * current.conjugate() * 3.0
-            res_dict["source_id"].append(source_id)
-            res_dict["current"].append(current)
-            res_dict["power"].append(power)
-            res_dict["voltage"].append(potential * np.sqrt(3.0))
         return pd.DataFrame(res_dict).astype(dtypes).set_index("source_id")
 
     #
@@ -961,6 +954,82 @@ class ElectricalNetwork(JsonMixin):
         self._valid = False
         self._results_valid = False
 
+    @staticmethod
+    def _gather_branch_currents(branches: Collection[AbstractBranch], warning: bool) -> ComplexArray:
+        """Gather the currents results of branches in a single array.
+
+        Args:
+            branches:
+                The branches to get the currents of.
+
+            warning:
+                If True and if the results may be invalid, a warning is emitted.
+
+        Returns:
+            A complex array of shape (N, 2) with the currents at both sides of the N branches.
+        """
+        currents = np.empty((len(branches), 2), dtype=np.complex128)
+        for i, branch in enumerate(branches):
+            currents[i] = branch._res_currents_getter(warning=warning)
+        return currents
+
+    @staticmethod
+    def _gather_currents_and_potentials(
+        elements: Collection[AbstractLoad | VoltageSource], warning: bool
+    ) -> tuple[ComplexArray, ComplexArray]:
+        """Gather the currents and potentials results of loads or sources in two arrays.
+
+        Args:
+            elements:
+                The loads or sources to get the results of.
+
+            warning:
+                If True and if the results may be invalid, a warning is emitted.
+
+        Returns:
+            Two complex arrays of shape (N,) with the currents and the potentials of the N elements.
+        """
+        currents = np.empty(len(elements), dtype=np.complex128)
+        potentials = np.empty(len(elements), dtype=np.complex128)
+        for i, element in enumerate(elements):
+            currents[i] = element._res_current_getter(warning=warning)
+            potentials[i] = element._res_potential_getter(warning=False)
+        return currents, potentials
+
+    @staticmethod
+    def _gather_buses_potentials(buses: Collection[Bus], warning: bool) -> ComplexArray:
+        """Gather the potentials results of buses in a single array.
+
+        Args:
+            buses:
+                The buses to get the potentials of.
+
+            warning:
+                If True and if the results may be invalid, a warning is emitted.
+
+        Returns:
+            A complex array of shape (N,) with the potentials of the N buses.
+        """
+        return np.fromiter(
+            (bus._res_potential_getter(warning=warning) for bus in buses), dtype=np.complex128, count=len(buses)
+        )
+
+    @staticmethod
+    def _gather_buses_voltages(buses: Collection[Bus], warning: bool) -> ComplexArray:
+        """Gather the voltages results of buses in a single array.
+
+        Args:
+            buses:
+                The buses to get the voltages of.
+
+            warning:
+                If True and if the results may be invalid, a warning is emitted.
+
+        Returns:
+            A complex array of shape (N,) with the voltages of the N buses.
+        """
+        return ElectricalNetwork._gather_buses_potentials(buses, warning=warning) * SQRT3
+
     def _create_network(self) -> None:
         """Create the Cython and C++ electrical network of all the passed elements."""
         self._valid = True
@@ -1082,7 +1151,7 @@ class ElectricalNetwork(JsonMixin):
         starting_source = None
         potential = None
         # if there are multiple voltage sources, start from the higher one (the last one in the sorted below)
-        for source in sorted(self.sources.values(), key=lambda x: np.average(np.abs(x._voltage))):
+        for source in sorted(self.sources.values(), key=lambda x: abs(x._voltage)):
             source_voltage = source._voltage
             starting_source = source
             potential = source_voltage
@@ -1122,9 +1191,50 @@ class ElectricalNetwork(JsonMixin):
         network._results_valid = has_results
         return network
 
+    @classmethod
+    def from_json(cls, path: StrPath, *, include_results: bool = True) -> Self:
+        """Construct an electrical network from a JSON file created with :meth:`to_json`.
+
+        The file is decoded with :mod:`orjson` if it is installed.
+
+        Args:
+            path:
+                The path to the network data file.
+
+            include_results:
+                If True (default) and the results of the load flow are included in the file,
+                the results are also loaded into the network.
+
+        Returns:
+            The constructed network.
+        """
+        return cls.from_dict(data=json_load(path), include_results=include_results)
+
     def _to_dict(self, include_results: bool) -> JsonDict:
         return network_to_dict(en=self, include_results=include_results)
 
+    def to_json(self, path: StrPath, *, include_results: bool = True) -> Path:
+        """Save the network to a JSON file.
+
+        The file is encoded with :mod:`orjson` if it is installed.
+
+        .. warning::
+            If the file exists, it will be overwritten.
+
+        Args:
+            path:
+                The path to the output file to write the network to. It is expanded then resolved
+                before writing the file.
+
+            include_results:
+                If True (default), the results of the load flow are included in the JSON file.
+                If no results are available, this option is ignored.
+
+        Returns:
+            The expanded and resolved path of the written file.
+        """
+        return json_dump(self.to_dict(include_results=include_results), path)
+
     #
     # Results saving
     #
@@ -1,3 +1,4 @@
+import copy
 import itertools as it
 import json
 import re
@@ -473,6 +474,32 @@ def test_to_from_dict_roundtrip(small_network: ElectricalNetwork):
     assert_frame_equal(small_network.sources_frame, new_net.sources_frame)
 
 
+def test_from_dict_does_not_modify_data(small_network_with_results):
+    data = small_network_with_results.to_dict()
+    expected_data = copy.deepcopy(data)
+    ElectricalNetwork.from_dict(data)
+    assert data == expected_data
+
+
+def test_json_non_finite_floats_and_keys(tmp_path, monkeypatch):
+    import roseau.load_flow_single.io._json as json_module
+
+    data = {"a": [1.0, float("nan")], "b": {"c": float("inf"), "d": None}, 1: -float("inf")}
+    expected = {"a": [1.0, float("nan")], "b": {"c": float("inf"), "d": None}, "1": -float("inf")}
+    for with_orjson in (True, False):
+        if not with_orjson:
+            monkeypatch.setattr(json_module, "orjson", None)
+        path = json_module.json_dump(data, tmp_path / "data.json")
+        assert path.read_text() == (
+            '{\n  "a": [1.0, NaN],\n  "b": {\n    "c": Infinity,\n    "d": null\n  },\n  "1": -Infinity\n}\n'
+        )
+        loaded = json_module.json_load(path)
+        assert json.dumps(loaded) == json.dumps(expected)
+        # The files without non-finite floats decode to the same data whatever the encoder
+        path = json_module.json_dump({"a": [1.0, 1e-8], "b": 2.0334335949305813e-6, 1: None}, tmp_path / "data.json")
+        assert json_module.json_load(path) == {"a": [1.0, 1e-8], "b": 2.0334335949305813e-6, "1": None}
+
+
 def test_network_elements(small_network: ElectricalNetwork):
     # Add a line to the network ("bus2" constructor belongs to the network)
     bus1 = small_network.buses["bus1"]